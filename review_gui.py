@@ -9,18 +9,34 @@ No direct LLM/TTS calls - all generation goes through src/ai_radio/api/
 to ensure proper lyrics context, validation, and audit loop.
 """
 import streamlit as st
+from streamlit.runtime.media_file_storage import MediaFileStorageError
+import csv
+import functools
+import io
+import itertools
 import json
-import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, asdict
-import base64
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
 import sys
+import threading
 import time
 import logging
 
+try:
+    import orjson  # faster JSON for status/queue files; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    # Imported where used: only the review list's filter frame needs pandas
+    import numpy as np
+    import pandas as pd
+
 # Configure logging for generation tracking
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -40,7 +56,8 @@ from src.ai_radio.gui import backend as gui_backend
 DATA_DIR = Path("data")
 GENERATED_DIR = DATA_DIR / "generated"
 AUDIT_DIR = DATA_DIR / "audit"
-REGEN_QUEUE_FILE = DATA_DIR / "regeneration_queue.json"
+REGEN_QUEUE_FILE = DATA_DIR / "regeneration_queue.jsonl"
+LEGACY_REGEN_QUEUE_FILE = DATA_DIR / "regeneration_queue.json"
 CATALOG_FILE = DATA_DIR / "catalog.json"
 LYRICS_DIR = Path("music_with_lyrics")
 
@@ -48,72 +65,155 @@ LYRICS_DIR = Path("music_with_lyrics")
 CONTENT_TYPES = ["intros", "outros", "time", "weather"]
 DJS = ["julie", "mr_new_vegas"]
 
-# Failure reason categories by content type
+# Audit file suffix per content type ("{item_id}_{suffix}_audit.json"): the
+# audit stage's names (core.paths) first, then the short names used by older
+# audit runs and the sample data
+_AUDIT_SUFFIXES = {
+    "intros": ("song_intro", "intro"),
+    "outros": ("song_outro", "outro"),
+    "time": ("time_announcement", "time"),
+    "weather": ("weather_announcement", "weather"),
+}
+
+# Generated file naming: trailing version number (julie_1, julie_outro_2) and
+# audio reference suffix (julie_1_full, julie_outro_30sec = outro version 0)
+_VERSION_RE = re.compile(r'_(\d+)$')
+_AUDIO_REF_RE = re.compile(r'(?:_(\d+))?_(30sec|full)$')
+# Version number of any script/audio stem, with or without a reference suffix
+_VERSION_SUFFIX_RE = re.compile(r'_(\d+)(?:_(?:30sec|full))?$')
+# Lyrics file stems: "Title by Artist"; song IDs use underscores for spaces
+_SONG_FILE_RE = re.compile(r'(.+?)\s+by\s+(.+)')
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+# Folder name -> display text (format_song_title): Name__Nickname__Surname,
+# apostrophe contractions (I_m, Don_t, We_ll) and runs of whitespace
+_NICKNAME_RE = re.compile(r'([A-Z][a-z]+)__([A-Z][a-z]+(?:_[A-Z][a-z]+)?)__([A-Z][a-z]+)')
+_SHORT_CONTRACTION_RE = re.compile(r"_([mstMST])(?=_|$)")
+_LONG_CONTRACTION_RE = re.compile(r"_(ll|re|ve|d)(?=_|$)")
+_WHITESPACE_RE = re.compile(r'\s+')
+# Characters dropped when fuzzy-matching lyrics file names
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
+# Worker threads for the per-item part of the content scan (I/O bound)
+SCAN_WORKERS = 16
+
+# Seconds a content scan is trusted for. The fingerprint only sees directory
+# mtimes, so this bounds how long an in-place edit by another writer (e.g. the
+# version manager rewriting review_status.json) can go unnoticed.
+SCAN_TTL = 60
+
+# Failure reason categories by content type (tuples: fixed option lists)
+# Intros and outros share one tuple
+_SONG_SCRIPT_ISSUES = (
+    "Character voice mismatch",
+    "Wrong era references",
+    "Forbidden elements (swearing, modern references)",
+    "Unnatural flow",
+    "Wrong length",
+    "Doesn't incorporate lyrics",
+    "Factually incorrect",
+)
+
 SCRIPT_ISSUES = {
-    "intros": [
+    "intros": _SONG_SCRIPT_ISSUES,
+    "outros": _SONG_SCRIPT_ISSUES,
+    "time": (
         "Character voice mismatch",
-        "Wrong era references",
-        "Forbidden elements (swearing, modern references)",
         "Unnatural flow",
         "Wrong length",
-        "Doesn't incorporate lyrics",
-        "Factually incorrect"
-    ],
-    "outros": [
-        "Character voice mismatch",
-        "Wrong era references",
-        "Forbidden elements (swearing, modern references)",
-        "Unnatural flow",
-        "Wrong length",
-        "Doesn't incorporate lyrics",
-        "Factually incorrect"
-    ],
-    "time": [
-        "Character voice mismatch",
-        "Unnatural flow",
-        "Wrong length",
-        "Incorrect time"
-    ],
-    "weather": [
+        "Incorrect time",
+    ),
+    "weather": (
         "Character voice mismatch",
         "Doesn't incorporate weather data",
         "Unnatural flow",
         "Wrong length",
-        "Factually incorrect"
-    ]
+        "Factually incorrect",
+    ),
 }
 
-AUDIO_ISSUES = [
+AUDIO_ISSUES = (
     "Garbled/distorted audio",
     "Wrong voice",
     "Mispronunciation",
     "Pacing issues",
     "Volume issues",
     "Audio artifacts",
-    "Unnatural intonation"
-]
+    "Unnatural intonation",
+)
+
+# Column order for the review CSV export
+EXPORT_COLUMNS = (
+    "content_type", "dj", "item_id", "latest_version", "audit_status",
+    "review_status", "reviewed_at", "script_issues", "audio_issues", "reviewer_notes",
+)
+
+# Sidebar filter options, with each option's position for the widgets' index=
+CONTENT_TYPE_OPTIONS = ("All", *CONTENT_TYPES)
+DJ_OPTIONS = ("All", *DJS)
+AUDIT_STATUS_OPTIONS = ("All", "Passed", "Failed")
+REVIEW_STATUS_OPTIONS = ("All", "Pending", "Approved", "Rejected")
+CONTENT_TYPE_INDEX = {option: i for i, option in enumerate(CONTENT_TYPE_OPTIONS)}
+DJ_INDEX = {option: i for i, option in enumerate(DJ_OPTIONS)}
+AUDIT_STATUS_INDEX = {option: i for i, option in enumerate(AUDIT_STATUS_OPTIONS)}
+REVIEW_STATUS_INDEX = {option: i for i, option in enumerate(REVIEW_STATUS_OPTIONS)}
+
+ITEMS_PER_PAGE_OPTIONS = (1, 3, 5, 10, 20)
+
+# Main views (session value -> label)
+VIEW_TABS = {
+    "Review": "📋 Review",
+    "Catalog": "🎵 Catalog",
+}
+
+# Reference audio choices for dual-audio versions (ref_type -> label)
+AUDIO_REF_TABS = {
+    "30sec": "📻 30sec",
+    "full": "📻 Full",
+}
+
+# Shared style for the "page / total" indicator in pagination bars
+PAGE_INDICATOR_STYLE = (
+    "text-align: center; padding: 8px; background: rgba(128,128,128,0.1); "
+    "border-radius: 8px; border: 1px solid rgba(128,128,128,0.2);"
+)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewItem:
-    """Represents a script/audio pair for review."""
+    """Represents a script/audio pair for review.
+    
+    Slotted: a scan holds one instance per generated item, so skipping the
+    per-instance __dict__ keeps large libraries cheap to cache. Frozen, since
+    an item is a snapshot of one scan; it hashes on its scalar fields.
+    """
     content_type: str
     dj: str
     item_id: str
     folder_path: Path
-    script_versions: List[Path]
-    audio_versions: List[Path]  # Legacy: single audio per version
-    audio_30sec: Dict[int, Path] = None  # version -> 30sec audio path
-    audio_full: Dict[int, Path] = None   # version -> full audio path
+    script_versions: List[Path] = field(hash=False)
+    audio_versions: List[Path] = field(hash=False)  # Legacy: single audio per version
+    audio_30sec: Dict[int, Path] = field(default=None, hash=False)  # version -> 30sec audio path
+    audio_full: Dict[int, Path] = field(default=None, hash=False)   # version -> full audio path
     latest_version: int = 0
     audit_status: Optional[str] = None
     review_status: Optional[str] = None
+    review_status_data: Dict[str, Any] = field(default=None, hash=False)  # full review_status.json contents
+    script_backups: Dict[str, Path] = field(default=None, hash=False)  # script file name -> .original backup (from the scan)
+    item_id_lower: str = field(init=False, repr=False, compare=False)  # search key
     
     def __post_init__(self):
+        # Frozen: derived and defaulted fields are filled in via object.__setattr__
+        set_field = functools.partial(object.__setattr__, self)
+        # Lowercased, underscores as spaces - what the search box matches against
+        set_field('item_id_lower', self.item_id.lower().replace('_', ' '))
         if self.audio_30sec is None:
-            self.audio_30sec = {}
+            set_field('audio_30sec', {})
         if self.audio_full is None:
-            self.audio_full = {}
+            set_field('audio_full', {})
+        if self.review_status_data is None:
+            set_field('review_status_data', default_review_status())
+        if self.script_backups is None:
+            set_field('script_backups', {})
     
     def get_script_path(self, version: int = None) -> Optional[Path]:
         """Get script path for a specific version (or latest)."""
@@ -148,6 +248,13 @@ class ReviewItem:
             return self.audio_versions[version]
         return None
     
+    def get_backup_path(self, version: int = None) -> Optional[Path]:
+        """Get the pre-edit backup of a version's script, if one was scanned."""
+        script_path = self.get_script_path(version)
+        if script_path is None:
+            return None
+        return self.script_backups.get(script_path.name)
+    
     def has_dual_audio(self, version: int = None) -> bool:
         """Check if both 30sec and full audio exist for this version."""
         if version is None:
@@ -157,14 +264,53 @@ class ReviewItem:
 
 
 
-def load_review_status(folder_path: Path) -> Dict[str, Any]:
-    """Load review status from review_status.json in folder."""
-    status_file = folder_path / "review_status.json"
-    if status_file.exists():
-        try:
-            return json.loads(status_file.read_text(encoding='utf-8'))
-        except Exception:
-            pass
+def _json_default(obj):
+    """stdlib json fallback for the types orjson encodes natively (datetime)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson when available (datetimes as ISO 8601)."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
+
+def read_file_bytes(path) -> bytes:
+    """Read a whole file with one fstat-sized os.read.
+    
+    Skips the buffered file object Path.read_bytes builds (and its extra
+    fstat/lseek/ioctl calls), which adds up over a cold scan's status reads.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        # One byte past the stat'd size notices a file that grew meanwhile
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+# Parsed review_status.json per path: {path: ((mtime_ns, size), status)}
+StatusMemo = Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]
+
+
+def default_review_status() -> Dict[str, Any]:
+    """Review status for items that have never been reviewed."""
     return {
         "status": "pending",
         "reviewed_at": None,
@@ -174,254 +320,751 @@ def load_review_status(folder_path: Path) -> Dict[str, Any]:
     }
 
 
+def load_review_status(folder_path: Path) -> Dict[str, Any]:
+    """Load review status from review_status.json in folder.
+    
+    Parsed files are memoized per path and reused while the file's
+    (mtime, size) is unchanged; callers get their own top-level copy, so
+    updating keys before save_review_status is safe.
+    """
+    return _load_review_status(folder_path, _review_status_memo())
+
+
+def _load_review_status(folder_path: Path, memo: StatusMemo) -> Dict[str, Any]:
+    """load_review_status against an explicit memo.
+    
+    Scan workers run off the script thread, so they are handed the memo
+    instead of reaching into st.cache_resource themselves.
+    """
+    status_file = folder_path / "review_status.json"
+    try:
+        stat = status_file.stat()
+    except OSError:
+        return default_review_status()
+    
+    path = str(status_file)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    hit = memo.get(path)
+    if hit is None or hit[0] != stamp:
+        try:
+            status = json_loads(read_file_bytes(status_file))
+        except Exception:
+            status = default_review_status()
+        hit = memo[path] = (stamp, status)
+    return dict(hit[1])
+
+
+@st.cache_resource
+def _review_status_memo() -> StatusMemo:
+    """Parsed review_status.json per path: {path: ((mtime_ns, size), status)}.
+    
+    Held by st.cache_resource because Streamlit re-executes this script on
+    every rerun, which would start a module-level cache over each time. One
+    entry per file, so it can't grow past the library's size.
+    """
+    return {}
+
+
 def save_review_status(folder_path: Path, status: Dict[str, Any]):
-    """Save review status to review_status.json in folder."""
+    """Save review status to review_status.json in folder.
+    
+    Nothing is written if the file already holds the same status. Otherwise
+    the JSON goes to a temp file that replaces the original, so a crash
+    mid-write can't leave a truncated status file behind.
+    
+    The review list's scan is patched with the new status rather than
+    redone, so approving or rejecting an item doesn't rescan the library.
+    """
     status_file = folder_path / "review_status.json"
-    status_file.write_text(json.dumps(status, indent=2), encoding='utf-8')
+    data = json_dumps(status, indent=True)
+    try:
+        if read_file_bytes(status_file) == data:
+            return
+    except OSError:
+        pass  # No status saved yet
+    before = _content_fingerprint()
+    tmp_file = status_file.with_name(status_file.name + ".tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, status_file)
+    content_scan().update_review_status(folder_path, status, before, _content_fingerprint())
 
 
-def get_audit_status(content_type: str, dj: str, item_id: str) -> Optional[str]:
-    """Check audit status by looking in audit directory."""
+def build_audit_index() -> Dict[Tuple[str, str], str]:
+    """Map (dj, audit file name) -> "passed"/"failed".
+    
+    One directory listing per DJ and status replaces two exists() probes per
+    item during a scan.
+    """
+    audit_index = {}
+    for dj in DJS:
+        # failed first so passed wins if a file is somehow in both
+        for status in ("failed", "passed"):
+            try:
+                with os.scandir(AUDIT_DIR / dj / status) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('_audit.json'):
+                            audit_index[(dj, entry.name)] = status
+            except FileNotFoundError:
+                continue
+    return audit_index
+
+
+def current_audit_index() -> Dict[Tuple[str, str], str]:
+    """Audit index for code outside the scan (e.g. the song editor).
+    
+    Cached on the audit status directories' mtimes, which change whenever an
+    audit file is added, moved or removed, so repeat lookups cost a few
+    stat() calls instead of two probes per item.
+    """
+    return _audit_index_cached(str(AUDIT_DIR), _audit_stamps())
+
+
+def _audit_stamps() -> tuple:
+    """mtimes of the audit status directories (None where one is missing)."""
+    stamps = []
+    for dj in DJS:
+        for status in ("failed", "passed"):
+            try:
+                stamps.append(os.stat(AUDIT_DIR / dj / status).st_mtime_ns)
+            except FileNotFoundError:
+                stamps.append(None)
+    return tuple(stamps)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _audit_index_cached(audit_dir: str, stamps: tuple) -> Dict[Tuple[str, str], str]:
+    """Cached wrapper; the arguments are only the cache key."""
+    return build_audit_index()
+
+
+def get_audit_status(content_type: str, dj: str, item_id: str,
+                     audit_index: Optional[Dict[Tuple[str, str], str]] = None) -> Optional[str]:
+    """Check audit status by looking in audit directory (or a prebuilt audit index)."""
     # Normalize item_id for audit file naming
     safe_id = item_id.replace("/", "_").replace("\\", "_")
     
-    for status in ["passed", "failed"]:
-        audit_file = AUDIT_DIR / dj / status / f"{safe_id}_{content_type.rstrip('s')}_audit.json"
-        if audit_file.exists():
-            return status
+    for suffix in _AUDIT_SUFFIXES[content_type]:
+        audit_name = f"{safe_id}_{suffix}_audit.json"
+        if audit_index is not None:
+            status = audit_index.get((dj, audit_name))
+            if status:
+                return status
+            continue
+        for status in ["passed", "failed"]:
+            audit_file = AUDIT_DIR / dj / status / audit_name
+            if audit_file.exists():
+                return status
     return None
 
 
+def _version_sort_key(path: Path) -> Tuple[int, str]:
+    """Sort key ordering version files numerically (unnumbered = version 0)."""
+    match = _VERSION_SUFFIX_RE.search(path.stem)
+    return (int(match.group(1)) if match else 0, path.name)
+
+
 def _scan_item_folder(item_folder: Path, dj: str, content_type: str) -> Optional[dict]:
     """Scan a single item folder and return its content info.
     
-    Returns dict with script_versions, audio_versions, audio_30sec, audio_full, latest_version
-    or None if folder has no content.
-    """
-    # Find all versions of scripts and audio
-    # Note: outros use different naming convention (_outro instead of _0)
-    if content_type == "outros":
-        # For outros: julie_outro.txt, julie_outro_1.txt, etc.
-        script_versions = sorted(item_folder.glob(f"{dj}_outro*.txt"))
-        audio_versions = sorted(item_folder.glob(f"{dj}_outro*.wav"))
-    else:
-        # For other types: julie_0.txt, julie_1.txt, etc.
-        script_versions = sorted(item_folder.glob(f"{dj}_*.txt"))
-        audio_versions = sorted(item_folder.glob(f"{dj}_*.wav"))
+    One os.scandir pass buckets scripts and audio and parses version numbers
+    as it goes. The "{dj}_" prefix covers both naming conventions
+    (julie_0.txt, julie_1_full.wav / julie_outro.txt, julie_outro_1.wav).
     
-    if not script_versions and not audio_versions:
-        return None
+    Manual-edit backups (julie_0.txt.original, or the older julie_0.original)
+    are recorded per script file name so rendering never has to probe for them.
     
-    # Determine latest version number and categorize audio by ref type
-    latest_version = 0
-    audio_30sec = {}  # version -> path
-    audio_full = {}   # version -> path
+    File paths are built as item_folder / name: joining one component is much
+    cheaper than having pathlib re-parse each entry's full path string.
     
-    for path in script_versions:
-        try:
-            stem_parts = path.stem.split('_')
-            if content_type == "outros":
-                if len(stem_parts) > 2:
-                    version = int(stem_parts[-1])
-                    latest_version = max(latest_version, version)
-            else:
-                version = int(stem_parts[-1])
-                latest_version = max(latest_version, version)
-        except (ValueError, IndexError):
-            pass
+    The same pass notes whether a review_status.json is present, so folders
+    that were never reviewed skip the stat and read in load_review_status.
     
-    for path in audio_versions:
-        try:
-            stem_parts = path.stem.split('_')
-            # Check for new naming: dj_version_reftype.wav (e.g., mr_new_vegas_0_30sec.wav)
-            if stem_parts[-1] == '30sec':
-                # mr_new_vegas_0_30sec -> version is stem_parts[-2]
-                version = int(stem_parts[-2])
-                audio_30sec[version] = path
-                latest_version = max(latest_version, version)
-            elif stem_parts[-1] == 'full':
-                # mr_new_vegas_0_full -> version is stem_parts[-2]
-                version = int(stem_parts[-2])
-                audio_full[version] = path
-                latest_version = max(latest_version, version)
-            else:
-                # Legacy naming: dj_version.wav (e.g., mr_new_vegas_0.wav)
-                if content_type == "outros":
-                    if len(stem_parts) > 2:
-                        version = int(stem_parts[-1])
-                        latest_version = max(latest_version, version)
+    Returns dict with script_versions, audio_versions, audio_30sec, audio_full,
+    script_backups, latest_version, has_review_status or None if folder has
+    no content.
+    """
+    prefix = f"{dj}_"
+    script_versions = []  # (version, path) until sorted below
+    script_backups = {}  # script file name -> backup path
+    audio_versions = []   # (version, path) until sorted below
+    audio_30sec = {}  # version -> path
+    audio_full = {}   # version -> path
+    has_review_status = False
+    
+    with os.scandir(item_folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith(prefix):
+                if name == "review_status.json":
+                    has_review_status = True
+                continue
+            if name.endswith('.original'):
+                script_name = name[:-len('.original')]
+                if script_name.endswith('.txt'):
+                    script_backups[script_name] = item_folder / name
                 else:
-                    version = int(stem_parts[-1])
-                    latest_version = max(latest_version, version)
-                    # Store legacy audio in audio_full for backwards compatibility
-                    if version not in audio_full:
+                    script_backups.setdefault(script_name + '.txt', item_folder / name)
+                continue
+            stem = name[:-4]
+            if name.endswith('.txt'):
+                match = _VERSION_RE.search(stem)
+                version = int(match.group(1)) if match else 0
+                script_versions.append((version, item_folder / name))
+            elif name.endswith('.wav'):
+                path = item_folder / name
+                # New naming: dj_version_reftype.wav (e.g., mr_new_vegas_0_30sec.wav);
+                # outro version 0 has no number (julie_outro_full.wav)
+                ref_match = _AUDIO_REF_RE.search(stem)
+                if ref_match:
+                    version = int(ref_match.group(1) or 0)
+                    audio_versions.append((version, path))
+                    if ref_match.group(2) == '30sec':
+                        audio_30sec[version] = path
+                    else:
                         audio_full[version] = path
-        except (ValueError, IndexError):
-            pass
+                    continue
+                # Legacy naming: dj_version.wav (e.g., mr_new_vegas_0.wav / julie_outro.wav)
+                match = _VERSION_RE.search(stem)
+                version = int(match.group(1)) if match else 0
+                audio_versions.append((version, path))
+                # Store legacy audio in audio_full for backwards compatibility
+                # (an explicit _full file for the same version wins)
+                audio_full.setdefault(version, path)
+    
+    if not script_versions and not audio_versions:
+        return None
+    
+    # Numeric version order (julie_2 before julie_10), so list index matches
+    # version number for get_script_path(); name breaks ties. The last entry
+    # of each list then holds its highest version.
+    script_versions.sort()
+    audio_versions.sort()
+    latest_version = max(versions[-1][0] for versions in (script_versions, audio_versions) if versions)
     
     return {
-        'script_versions': script_versions,
-        'audio_versions': audio_versions,
+        'script_versions': [path for _, path in script_versions],
+        'audio_versions': [path for _, path in audio_versions],
         'audio_30sec': audio_30sec,
         'audio_full': audio_full,
+        'script_backups': script_backups,
         'latest_version': latest_version,
+        'has_review_status': has_review_status,
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _dj_dirs_under(generated_dir: Path, content_type: str, dj: str) -> Tuple[Path, Path]:
+    """Memoized (legacy doubled, new single) DJ directories under a root."""
+    return generated_dir / content_type / content_type / dj, generated_dir / content_type / dj
+
+
+def _dj_dirs(content_type: str, dj: str) -> Tuple[Path, Path]:
+    """(legacy doubled, new single) directories for one content type and DJ.
+    
+    Built once per root rather than with two Path joins per call site and
+    per song probed.
+    """
+    return _dj_dirs_under(GENERATED_DIR, content_type, dj)
+
+
+def _content_fingerprint() -> tuple:
+    """Signature of the generated and audit trees from directory mtimes.
+    
+    Adding or removing a version file bumps its item folder's mtime, so item
+    folders are stat'ed but the files inside them are not. The cost is one
+    scandir per DJ dir plus one stat() per item folder: DirEntry.stat() is
+    answered from the listing on Windows but is a syscall per folder on
+    POSIX. It runs on every rerun of the review tab, once a second while a
+    background rescan is being watched, and twice per review-status save.
+    """
+    dj_dirs = []
+    stat_only = [GENERATED_DIR]
+    for content_type in CONTENT_TYPES:
+        stat_only.append(GENERATED_DIR / content_type)
+        for dj in DJS:
+            dj_dirs.extend(_dj_dirs(content_type, dj))  # Legacy doubled and new single paths
+    for dj in DJS:
+        for status in ("passed", "failed"):
+            stat_only.append(AUDIT_DIR / dj / status)
+    
+    signature = []
+    for directory in stat_only:
+        try:
+            signature.append((str(directory), directory.stat().st_mtime_ns))
+        except OSError:
+            pass
+    for dj_dir in dj_dirs:
+        try:
+            with os.scandir(dj_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        signature.append((entry.path, entry.stat().st_mtime_ns))
+        except OSError:
+            pass
+    return tuple(signature)
+
+
 def scan_generated_content() -> List[ReviewItem]:
     """Scan data/generated directory for all content.
     
+    Goes through the shared content_scan(), waiting for a rescan when the
+    content fingerprint has changed, so callers always get the current items.
+    """
+    (items, _), _ = content_scan().get(_content_fingerprint(), wait=True)
+    return items
+
+
+class BackgroundScan:
+    """Latest content scan for the review list, rescanned off the script thread.
+    
+    When the content fingerprint changes (e.g. a generation run lands new
+    files), the rescan runs on a daemon thread and callers keep the previous
+    result meanwhile. Only the first scan, or the one after invalidate(),
+    makes the caller wait. A result older than SCAN_TTL is refreshed the same
+    way but still counts as current.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._result = None   # (fingerprint, items, frame) of the last finished scan
+        self._scanned_at = 0.0  # time.monotonic() when that scan started
+        self._pending = None  # fingerprint the worker thread is scanning
+        self._generation = 0  # bumped by invalidate(); older workers' results are dropped
+    
+    def get(self, fingerprint: tuple, wait: bool = False) -> Tuple[Tuple[List[ReviewItem], "pd.DataFrame"], bool]:
+        """Return ((items, frame), is_current) for the given fingerprint.
+        
+        Starts a rescan if the fingerprint is new. Blocks until the worker is
+        done when wait is set or there is no earlier result to show.
+        """
+        with self._cond:
+            current = self._result is not None and self._result[0] == fingerprint
+            expired = time.monotonic() - self._scanned_at > SCAN_TTL
+            if (not current or expired) and self._pending != fingerprint:
+                self._start(fingerprint)
+            if wait or self._result is None:
+                self._cond.wait_for(lambda: self._pending is None)
+            result = self._result
+        if result is None:
+            # The worker failed (and logged why); scan here so the error surfaces
+            items = _scan_generated_content(*_scan_caches())
+            return (items, build_item_frame(items)), True
+        return (result[1], result[2]), result[0] == fingerprint
+    
+    def update_review_status(self, folder_path: Path, status: Dict[str, Any],
+                             before: tuple, after: tuple):
+        """Apply a just-saved review status to the last result instead of rescanning.
+        
+        before/after are the content fingerprints taken around the write. The
+        patched result stays current only if it was current for `before`, so
+        anything else that changed on disk still gets a normal rescan. Falls
+        back to invalidate() when the folder isn't in the result.
+        """
+        import pandas as pd
+        
+        with self._cond:
+            if self._result is None:
+                return
+            fingerprint, items, frame = self._result
+            rows = [row for row, item in enumerate(items) if item.folder_path == folder_path]
+            if not rows:
+                self.invalidate()
+                return
+            review_status = status.get("status", "pending")
+            if isinstance(review_status, str):
+                review_status = sys.intern(review_status)
+            items = list(items)
+            for row in rows:
+                items[row] = replace(items[row], review_status=review_status,
+                                     review_status_data=dict(status))
+            frame = frame.assign(review_status=pd.Categorical([i.review_status for i in items]))
+            if self._pending is not None:
+                # A scan already running may have read the old status - drop it
+                self._generation += 1
+                self._pending = None
+                self._cond.notify_all()
+            self._result = (after if fingerprint == before else fingerprint, items, frame)
+    
+    def invalidate(self):
+        """Forget the last result, e.g. after files changed behind the fingerprint."""
+        with self._cond:
+            self._generation += 1
+            self._result = None
+            self._pending = None
+            self._cond.notify_all()
+    
+    def _start(self, fingerprint: tuple):
+        self._pending = fingerprint
+        # Resolved here, on the script thread: the worker must not touch st caches
+        worker = threading.Thread(
+            target=self._run, args=(fingerprint, self._generation, *_scan_caches()),
+            name="content-scan", daemon=True
+        )
+        worker.start()
+    
+    def _run(self, fingerprint: tuple, generation: int, audit_index: Dict[Tuple[str, str], str],
+             status_memo: StatusMemo):
+        started = time.monotonic()
+        try:
+            items = _scan_generated_content(audit_index, status_memo)
+            result = (fingerprint, items, build_item_frame(items))
+        except Exception:
+            logger.exception("Background content scan failed")
+            result = None
+        with self._cond:
+            # A newer scan or an invalidate() supersedes this one
+            if generation == self._generation and self._pending == fingerprint:
+                if result is not None:
+                    self._result = result
+                    self._scanned_at = started
+                self._pending = None
+                self._cond.notify_all()
+
+
+@st.cache_resource
+def content_scan() -> BackgroundScan:
+    """The BackgroundScan shared by every session and rerun."""
+    return BackgroundScan()
+
+
+def build_item_frame(items: List[ReviewItem]) -> "pd.DataFrame":
+    """Build a columnar view of the fields the sidebar filters match on.
+    
+    Row i describes items[i]. item_id_lower is the search key (lowercased,
+    underscores as spaces). The low-cardinality columns are categoricals, so
+    the filter comparisons and status counts work on small integer codes.
+    """
+    import pandas as pd
+    
+    return pd.DataFrame({
+        'content_type': pd.Categorical([i.content_type for i in items]),
+        'dj': pd.Categorical([i.dj for i in items]),
+        'item_id_lower': pd.Series([i.item_id_lower for i in items], dtype=object),
+        'audit_status': pd.Categorical([i.audit_status for i in items]),
+        'review_status': pd.Categorical([i.review_status for i in items]),
+    })
+
+
+def _scan_caches() -> Tuple[Dict[Tuple[str, str], str], StatusMemo]:
+    """(audit index, review status memo) for _scan_generated_content.
+    
+    Both live in Streamlit caches, which must be read from the script
+    thread; the scan's worker threads get them as plain arguments.
+    """
+    return current_audit_index(), _review_status_memo()
+
+
+def _scan_generated_content(audit_index: Dict[Tuple[str, str], str],
+                            status_memo: StatusMemo) -> List[ReviewItem]:
+    """Walk data/generated and build ReviewItems (uncached).
+    
     Merges content from both legacy doubled paths (intros/intros/dj) 
     and new single paths (intros/dj) to handle transition period.
-    """
-    items = []
     
+    The tree is partitioned into one bucket per (content type, DJ). Bucket
+    listings and then the per-item work (version scans, audit lookup,
+    review_status.json read) are independent and I/O bound, so both run on
+    a small thread pool.
+    """
     if not GENERATED_DIR.exists():
-        return items
+        return []
     
-    for content_type in CONTENT_TYPES:
-        content_dir = GENERATED_DIR / content_type
-        if not content_dir.exists():
-            continue
+    buckets = [(content_type, dj) for content_type in CONTENT_TYPES for dj in DJS]
+    
+    # map() keeps job order, so items come back in the same order as a serial scan
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        scan_jobs = [job for jobs in pool.map(lambda bucket: _scan_bucket(*bucket), buckets) for job in jobs]
+        results = pool.map(lambda job: _build_review_item(*job, audit_index, status_memo), scan_jobs)
+        return [item for item in results if item is not None]
+
+
+def _list_subdirs(directory: Path) -> List[Tuple[str, Path]]:
+    """(name, path) of each subdirectory; empty if the directory is missing.
+    
+    Uses os.scandir, whose entries answer is_dir() from the directory listing
+    instead of a stat() per child; paths are joined onto directory rather than
+    re-parsed from each entry's full path.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [(entry.name, directory / entry.name) for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+def _scan_bucket(content_type: str, dj: str) -> List[tuple]:
+    """List one (content type, DJ) bucket's item folders as scan jobs.
+    
+    Returns (content_type, dj, item_id, folder_info, is_merged) tuples, where
+    folder_info is a (legacy, new) folder pair when the item exists under
+    both path structures.
+    """
+    legacy_dj_dir, new_dj_dir = _dj_dirs(content_type, dj)  # intros/intros/dj, intros/dj
+    
+    # Collect all item folders from both paths
+    item_folders_by_id = {}  # item_id -> (folder_info, is_merged)
+    
+    # First add legacy path items
+    for item_id, item_folder in _list_subdirs(legacy_dj_dir):
+        item_folders_by_id[item_id] = (item_folder, False)
+    
+    # Then add/override with new path items (new path takes priority)
+    for item_id, item_folder in _list_subdirs(new_dj_dir):
+        if item_id in item_folders_by_id:
+            # Both exist - we need to merge content from both
+            legacy_folder = item_folders_by_id[item_id][0]
+            item_folders_by_id[item_id] = ((legacy_folder, item_folder), True)
+        else:
+            item_folders_by_id[item_id] = (item_folder, False)
+    
+    return [
+        (content_type, dj, item_id, folder_info, is_merged)
+        for item_id, (folder_info, is_merged) in item_folders_by_id.items()
+    ]
+
+
+def _build_review_item(content_type: str, dj: str, item_id: str, folder_info, is_merged: bool,
+                       audit_index: Dict[Tuple[str, str], str],
+                       status_memo: StatusMemo) -> Optional[ReviewItem]:
+    """Scan one item's folder(s) and build its ReviewItem (None if empty)."""
+    if is_merged:
+        # Merge content from both folders
+        legacy_folder, new_folder = folder_info
+        legacy_content = _scan_item_folder(legacy_folder, dj, content_type)
+        new_content = _scan_item_folder(new_folder, dj, content_type)
+        
+        if not legacy_content and not new_content:
+            return None
+        
+        # Prefer new folder as primary, merge versions
+        primary_folder = new_folder
+        # Unknown if the new folder had no versions of its own - let the load check
+        has_review_status = new_content['has_review_status'] if new_content else True
+        
+        # Combine all versions from both folders
+        all_scripts = []
+        all_audio = []
+        merged_30sec = {}
+        merged_full = {}
+        merged_backups = {}
+        max_version = 0
+        
+        if legacy_content:
+            all_scripts.extend(legacy_content['script_versions'])
+            all_audio.extend(legacy_content['audio_versions'])
+            merged_30sec.update(legacy_content['audio_30sec'])
+            merged_full.update(legacy_content['audio_full'])
+            merged_backups.update(legacy_content['script_backups'])
+            max_version = max(max_version, legacy_content['latest_version'])
+        
+        if new_content:
+            all_scripts.extend(new_content['script_versions'])
+            all_audio.extend(new_content['audio_versions'])
+            merged_30sec.update(new_content['audio_30sec'])
+            merged_full.update(new_content['audio_full'])
+            merged_backups.update(new_content['script_backups'])
+            max_version = max(max_version, new_content['latest_version'])
+        
+        # Remove duplicates and sort by version number
+        script_versions = sorted(set(all_scripts), key=_version_sort_key)
+        audio_versions = sorted(set(all_audio), key=_version_sort_key)
         
-        for dj in DJS:
-            # Check both path structures and merge content
-            legacy_dj_dir = content_dir / content_type / dj  # doubled: intros/intros/dj
-            new_dj_dir = content_dir / dj                     # single: intros/dj
-            
-            # Collect all item folders from both paths
-            item_folders_by_id = {}  # item_id -> (folder_path, prefer_new)
-            
-            # First add legacy path items
-            if legacy_dj_dir.exists():
-                for item_folder in legacy_dj_dir.iterdir():
-                    if item_folder.is_dir():
-                        item_folders_by_id[item_folder.name] = (item_folder, False)
-            
-            # Then add/override with new path items (new path takes priority)
-            if new_dj_dir.exists():
-                for item_folder in new_dj_dir.iterdir():
-                    if item_folder.is_dir():
-                        item_id = item_folder.name
-                        if item_id in item_folders_by_id:
-                            # Both exist - we need to merge content from both
-                            legacy_folder = item_folders_by_id[item_id][0]
-                            item_folders_by_id[item_id] = ((legacy_folder, item_folder), True)
-                        else:
-                            item_folders_by_id[item_id] = (item_folder, False)
-            
-            # Process each item
-            for item_id, (folder_info, is_merged) in item_folders_by_id.items():
-                if is_merged:
-                    # Merge content from both folders
-                    legacy_folder, new_folder = folder_info
-                    legacy_content = _scan_item_folder(legacy_folder, dj, content_type)
-                    new_content = _scan_item_folder(new_folder, dj, content_type)
-                    
-                    if not legacy_content and not new_content:
-                        continue
-                    
-                    # Prefer new folder as primary, merge versions
-                    primary_folder = new_folder
-                    
-                    # Combine all versions from both folders
-                    all_scripts = []
-                    all_audio = []
-                    merged_30sec = {}
-                    merged_full = {}
-                    max_version = 0
-                    
-                    if legacy_content:
-                        all_scripts.extend(legacy_content['script_versions'])
-                        all_audio.extend(legacy_content['audio_versions'])
-                        merged_30sec.update(legacy_content['audio_30sec'])
-                        merged_full.update(legacy_content['audio_full'])
-                        max_version = max(max_version, legacy_content['latest_version'])
-                    
-                    if new_content:
-                        all_scripts.extend(new_content['script_versions'])
-                        all_audio.extend(new_content['audio_versions'])
-                        merged_30sec.update(new_content['audio_30sec'])
-                        merged_full.update(new_content['audio_full'])
-                        max_version = max(max_version, new_content['latest_version'])
-                    
-                    # Remove duplicates and sort
-                    script_versions = sorted(set(all_scripts), key=lambda p: p.name)
-                    audio_versions = sorted(set(all_audio), key=lambda p: p.name)
-                    
-                else:
-                    # Single folder
-                    item_folder = folder_info
-                    content = _scan_item_folder(item_folder, dj, content_type)
-                    if not content:
-                        continue
-                    
-                    primary_folder = item_folder
-                    script_versions = content['script_versions']
-                    audio_versions = content['audio_versions']
-                    merged_30sec = content['audio_30sec']
-                    merged_full = content['audio_full']
-                    max_version = content['latest_version']
-                
-                # Get audit and review status
-                audit_status = get_audit_status(content_type, dj, item_id)
-                review_status_data = load_review_status(primary_folder)
-                review_status = review_status_data.get("status", "pending")
-                
-                items.append(ReviewItem(
-                    content_type=content_type,
-                    dj=dj,
-                    item_id=item_id,
-                    folder_path=primary_folder,
-                    script_versions=script_versions,
-                    audio_versions=audio_versions,
-                    latest_version=max_version,
-                    audit_status=audit_status,
-                    review_status=review_status,
-                    audio_30sec=merged_30sec,
-                    audio_full=merged_full
-                ))
+    else:
+        # Single folder
+        item_folder = folder_info
+        content = _scan_item_folder(item_folder, dj, content_type)
+        if not content:
+            return None
+        
+        primary_folder = item_folder
+        script_versions = content['script_versions']
+        audio_versions = content['audio_versions']
+        merged_30sec = content['audio_30sec']
+        merged_full = content['audio_full']
+        merged_backups = content['script_backups']
+        max_version = content['latest_version']
+        has_review_status = content['has_review_status']
+    
+    # Get audit and review status
+    audit_status = get_audit_status(content_type, dj, item_id, audit_index)
+    review_status_data = (_load_review_status(primary_folder, status_memo) if has_review_status
+                          else default_review_status())
+    review_status = review_status_data.get("status", "pending")
+    if isinstance(review_status, str):
+        # One shared string per status instead of one per parsed JSON file
+        review_status = sys.intern(review_status)
+    
+    return ReviewItem(
+        content_type=sys.intern(content_type),
+        dj=sys.intern(dj),
+        item_id=item_id,
+        folder_path=primary_folder,
+        script_versions=script_versions,
+        audio_versions=audio_versions,
+        latest_version=max_version,
+        audit_status=audit_status,
+        review_status=review_status,
+        review_status_data=review_status_data,
+        audio_30sec=merged_30sec,
+        audio_full=merged_full,
+        script_backups=merged_backups
+    )
+
+
+def filter_items(items: List[ReviewItem], frame: Optional["pd.DataFrame"] = None) -> List[ReviewItem]:
+    """Apply filters to item list.
     
-    return items
+    Filters are combined as boolean masks over the item frame (built here if
+    the caller has none) and mapped back to the matching items. The review
+    tab works on row positions via filter_rows instead.
+    """
+    if frame is None:
+        frame = build_item_frame(items)
+    return [items[i] for i in frame.index[filter_mask(frame)]]
 
 
-def filter_items(items: List[ReviewItem]) -> List[ReviewItem]:
-    """Apply filters to item list."""
-    filtered = items
+def filter_mask(frame: "pd.DataFrame") -> "pd.Series":
+    """Boolean mask over an item frame for the current sidebar filters."""
+    import pandas as pd
+    
+    mask = pd.Series(True, index=frame.index)
     
     # Content type filter
     if st.session_state.filter_content_type != "All":
-        filtered = [i for i in filtered if i.content_type == st.session_state.filter_content_type]
+        mask &= frame['content_type'].eq(st.session_state.filter_content_type)
     
     # DJ filter
     if st.session_state.filter_dj != "All":
-        filtered = [i for i in filtered if i.dj == st.session_state.filter_dj]
+        mask &= frame['dj'].eq(st.session_state.filter_dj)
     
     # Audit status filter
     if st.session_state.filter_audit_status != "All":
-        filtered = [i for i in filtered if i.audit_status == st.session_state.filter_audit_status.lower()]
+        mask &= frame['audit_status'].eq(st.session_state.filter_audit_status.lower())
     
     # Review status filter
     if st.session_state.filter_review_status != "All":
-        filtered = [i for i in filtered if i.review_status == st.session_state.filter_review_status.lower()]
+        mask &= frame['review_status'].eq(st.session_state.filter_review_status.lower())
     
     # Search query - normalize underscores to spaces for better matching
     if st.session_state.search_query:
         query = st.session_state.search_query.lower().replace('_', ' ')
-        filtered = [i for i in filtered if query in i.item_id.lower().replace('_', ' ')]
+        mask &= search_hits(frame, query)
     
-    return filtered
+    return mask
 
 
-def add_to_regen_queue(item: ReviewItem, regenerate_type: str, feedback: str):
-    """Add an item to the regeneration queue."""
+def search_hits(frame: "pd.DataFrame", query: str) -> "np.ndarray":
+    """Boolean array of the frame rows whose search key contains query.
+    
+    Substring matching over one newline-joined string of every key: the
+    regex engine jumps from hit to hit, and a binary search over the keys'
+    start offsets maps each hit back to its row, rather than testing every
+    key in turn. The joined index is built once per frame.
+    """
+    import numpy as np
+    
+    memo = getattr(st.session_state, '_search_index', None)
+    if memo is None or memo[0] is not frame:
+        keys = frame['item_id_lower'].tolist()
+        starts = np.fromiter(itertools.accumulate((len(key) + 1 for key in keys[:-1]), initial=0),
+                             dtype=np.int64)
+        memo = st.session_state._search_index = (frame, '\n'.join(keys), starts)
+    _, joined, starts = memo
+    
+    hits = np.zeros(len(frame), dtype=bool)
+    if not len(frame) or '\n' in query:
+        # Keys hold no newlines, so a newline query matches nothing and a
+        # hit never spans two rows
+        return hits
+    offsets = np.fromiter((m.start() for m in re.finditer(re.escape(query), joined)), dtype=np.int64)
+    hits[np.searchsorted(starts, offsets, side='right') - 1] = True
+    return hits
+
+
+def filter_rows(frame: "pd.DataFrame") -> Tuple["pd.Index", "pd.Series"]:
+    """Row positions matching the current filters, and their review-status counts.
+    
+    Memoized in the session against the frame and the filter values, so
+    reruns that only touch a visible item (audio, version arrows, notes)
+    reuse the last result instead of re-masking the whole library.
+    """
+    state = st.session_state
+    signature = (state.filter_content_type, state.filter_dj, state.filter_audit_status,
+                 state.filter_review_status, state.search_query)
+    memo = getattr(state, '_filter_memo', None)
+    if memo is not None and memo[0] is frame and memo[1] == signature:
+        return memo[2]
+    mask = filter_mask(frame)
+    result = (frame.index[mask], frame.loc[mask, 'review_status'].value_counts())
+    # Holding the frame itself keeps the identity check sound
+    state._filter_memo = (frame, signature, result)
+    return result
+
+
+def paginate(items: List, page: int, per_page: int) -> Tuple[List, int, int]:
+    """Slice one page out of the filtered items.
+
+    Returns (page_items, page, total_pages) with page clamped into range, so
+    only that page's items are ever handed to the renderer.
+    """
+    total_pages = max(1, (len(items) + per_page - 1) // per_page)
+    page = min(max(page, 0), total_pages - 1)
+    start = page * per_page
+    return items[start:start + per_page], page, total_pages
+
+
+def _read_regen_queue() -> List[Dict]:
+    """Read the regeneration queue from disk (one JSON object per line).
+    
+    Returns an empty list if the file is missing or unreadable; malformed
+    lines are skipped.
+    """
+    try:
+        return _parse_regen_queue(REGEN_QUEUE_FILE.read_bytes())
+    except OSError:
+        return []
+
+
+def _parse_regen_queue(data: bytes) -> List[Dict]:
+    """Parse queue file contents, skipping blank and malformed lines."""
     queue = []
-    if REGEN_QUEUE_FILE.exists():
+    for line in data.splitlines():
+        if not line.strip():
+            continue
         try:
-            queue = json.loads(REGEN_QUEUE_FILE.read_text(encoding='utf-8'))
-        except Exception:
-            queue = []
-    
+            queue.append(json_loads(line))
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed queue line: {line.strip()[:80]!r}")
+    return queue
+
+
+def _append_regen_queue(*queue_items: Dict):
+    """Append items to the regeneration queue, one JSON line each."""
+    # One write() per call keeps a multi-item append contiguous when several
+    # sessions append to the same file
+    with open(REGEN_QUEUE_FILE, 'ab') as f:
+        f.write(b''.join(json_dumps(queue_item) + b'\n' for queue_item in queue_items))
+    # Keep the sidebar's session count in step without re-reading the file
+    if 'queue_count' in st.session_state:
+        st.session_state.queue_count += len(queue_items)
+
+
+def migrate_legacy_regen_queue():
+    """Move entries from the old JSON-array queue file into the JSONL queue."""
+    if not LEGACY_REGEN_QUEUE_FILE.exists():
+        return
+    try:
+        legacy_queue = json_loads(LEGACY_REGEN_QUEUE_FILE.read_bytes())
+    except Exception as e:
+        logger.warning(f"Could not migrate legacy regeneration queue: {e}")
+        return
+    if legacy_queue:
+        _append_regen_queue(*legacy_queue)
+    LEGACY_REGEN_QUEUE_FILE.unlink()
+
+
+def add_to_regen_queue(item: ReviewItem, regenerate_type: str, feedback: str):
+    """Add an item to the regeneration queue."""
     queue_item = {
         "content_type": item.content_type,
         "dj": item.dj,
@@ -429,51 +1072,86 @@ def add_to_regen_queue(item: ReviewItem, regenerate_type: str, feedback: str):
         "folder_path": str(item.folder_path),
         "regenerate_type": regenerate_type,
         "feedback": feedback,
-        "added_at": datetime.now().isoformat()
+        "added_at": datetime.now()
     }
     
-    queue.append(queue_item)
-    REGEN_QUEUE_FILE.write_text(json.dumps(queue, indent=2), encoding='utf-8')
+    _append_regen_queue(queue_item)
 
 
 def get_regen_queue_count() -> int:
     """Get number of items in regeneration queue."""
-    if not REGEN_QUEUE_FILE.exists():
-        return 0
     try:
-        queue = json.loads(REGEN_QUEUE_FILE.read_text(encoding='utf-8'))
-        return len(queue)
-    except Exception:
+        with open(REGEN_QUEUE_FILE, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+    except FileNotFoundError:
         return 0
 
 
+def consume_regen_queue(processed: int):
+    """Remove the first `processed` queue entries.
+    
+    Entries appended while a long processing run was in progress are kept
+    for the next run instead of being wiped with the rest of the queue.
+    The rest is written to a temp file that replaces the queue, and the
+    queue is re-read just before the replace so an append that lands while
+    the temp file is written isn't lost.
+    """
+    tmp_file = REGEN_QUEUE_FILE.with_name(REGEN_QUEUE_FILE.name + ".tmp")
+    while True:
+        try:
+            snapshot = REGEN_QUEUE_FILE.read_bytes()
+        except FileNotFoundError:
+            remaining = []
+            break
+        remaining = _parse_regen_queue(snapshot)[processed:]
+        tmp_file.write_bytes(b''.join(json_dumps(queue_item) + b'\n' for queue_item in remaining))
+        if REGEN_QUEUE_FILE.read_bytes() == snapshot:
+            os.replace(tmp_file, REGEN_QUEUE_FILE)
+            break
+    if 'queue_count' in st.session_state:
+        st.session_state.queue_count = len(remaining)
+
+
 def clear_regen_queue():
     """Clear the regeneration queue."""
-    if REGEN_QUEUE_FILE.exists():
-        REGEN_QUEUE_FILE.write_text("[]", encoding='utf-8')
+    try:
+        # r+b truncates in place without creating a queue file that isn't there
+        with open(REGEN_QUEUE_FILE, 'r+b') as f:
+            f.truncate()
+    except FileNotFoundError:
+        pass
+    if 'queue_count' in st.session_state:
+        st.session_state.queue_count = 0
 
 
 def load_catalog() -> List[Dict]:
     """Load the song catalog from catalog.json."""
-    if not CATALOG_FILE.exists():
-        return []
     try:
-        data = json.loads(CATALOG_FILE.read_text(encoding='utf-8'))
+        data = json_loads(read_file_bytes(CATALOG_FILE))
         return data.get("songs", [])
+    except FileNotFoundError:
+        return []
     except Exception as e:
         logger.error(f"Failed to load catalog: {e}")
         return []
 
 
-def get_song_generation_status(artist: str, title: str, dj: str) -> Dict[str, bool]:
-    """Check what has been generated for a song (intro/outro script and audio)."""
-    # Normalize names for folder lookup - must match pipeline's _make_song_folder()
-    # Pipeline uses: c if c.isalnum() or c in (' ', '-', '_') else '_'
+def make_song_folder_name(artist: str, title: str) -> str:
+    """Build the generated-content folder name for a song.
+    
+    Must match pipeline's _make_song_folder():
+    c if c.isalnum() or c in (' ', '-', '_') else '_'
+    """
     safe_artist = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in artist)
     safe_title = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in title)
     safe_artist = safe_artist.strip().replace(' ', '_')
     safe_title = safe_title.strip().replace(' ', '_')
-    folder_name = f"{safe_artist}-{safe_title}"
+    return f"{safe_artist}-{safe_title}"
+
+
+def get_song_generation_status(artist: str, title: str, dj: str) -> Dict[str, bool]:
+    """Check what has been generated for a song (intro/outro script and audio)."""
+    folder_name = make_song_folder_name(artist, title)
     
     status = {
         "intro_script": False,
@@ -482,55 +1160,37 @@ def get_song_generation_status(artist: str, title: str, dj: str) -> Dict[str, bo
         "outro_audio": False,
     }
     
-    # Check intros - both legacy doubled path and new single path
-    intro_paths = [
-        GENERATED_DIR / "intros" / "intros" / dj / folder_name,  # Legacy doubled path
-        GENERATED_DIR / "intros" / dj / folder_name,              # New single path
-    ]
-    for intro_path in intro_paths:
-        if intro_path.exists():
-            scripts = list(intro_path.glob(f"{dj}*.txt"))
-            audios = list(intro_path.glob(f"{dj}*.wav")) + list(intro_path.glob(f"*_30sec.wav")) + list(intro_path.glob(f"*_full.wav"))
-            if scripts:
-                status["intro_script"] = True
-            if audios:
-                status["intro_audio"] = True
-    
-    # Check outros - both legacy doubled path and new single path
-    outro_paths = [
-        GENERATED_DIR / "outros" / "outros" / dj / folder_name,  # Legacy doubled path
-        GENERATED_DIR / "outros" / dj / folder_name,              # New single path
-    ]
-    for outro_path in outro_paths:
-        if outro_path.exists():
-            scripts = list(outro_path.glob(f"{dj}*.txt"))
-            audios = list(outro_path.glob(f"{dj}*.wav")) + list(outro_path.glob(f"*_30sec.wav")) + list(outro_path.glob(f"*_full.wav"))
-            if scripts:
-                status["outro_script"] = True
-            if audios:
-                status["outro_audio"] = True
+    # Check intros and outros - both legacy doubled path and new single path.
+    # One listing per folder answers both questions (a missing folder is just
+    # an empty listing), instead of an exists() probe plus four globs.
+    for content_type, key in (("intros", "intro"), ("outros", "outro")):
+        for dj_dir in _dj_dirs(content_type, dj):
+            try:
+                names = os.listdir(dj_dir / folder_name)
+            except OSError:
+                continue
+            if any(n.startswith(dj) and n.endswith(".txt") for n in names):
+                status[f"{key}_script"] = True
+            if any(n.endswith(".wav") and (n.startswith(dj) or n.endswith(("_30sec.wav", "_full.wav")))
+                   for n in names):
+                status[f"{key}_audio"] = True
     
     return status
 
 
 def add_catalog_item_to_queue(artist: str, title: str, dj: str, content_type: str, regen_type: str):
-    """Add a catalog song to the regeneration queue for generation."""
-    # Normalize names for folder path - must match pipeline's _make_song_folder()
-    safe_artist = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in artist)
-    safe_title = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in title)
-    safe_artist = safe_artist.strip().replace(' ', '_')
-    safe_title = safe_title.strip().replace(' ', '_')
-    folder_name = f"{safe_artist}-{safe_title}"
+    """Add a catalog song to the regeneration queue for generation.
+    
+    Reads the whole queue to reject duplicates, since entries queued by other
+    sessions or the review tab aren't in this session's get_queued_keys()
+    set; the set only spares the read for songs already known to be queued.
+    """
+    folder_name = make_song_folder_name(artist, title)
     
     # Use single path structure (correct): intros/dj/folder
-    folder_path = GENERATED_DIR / content_type / dj / folder_name
+    folder_path = _dj_dirs(content_type, dj)[1] / folder_name
     
-    queue = []
-    if REGEN_QUEUE_FILE.exists():
-        try:
-            queue = json.loads(REGEN_QUEUE_FILE.read_text(encoding='utf-8'))
-        except Exception:
-            queue = []
+    queue = _read_regen_queue()
     
     # Check if already in queue
     for item in queue:
@@ -546,16 +1206,70 @@ def add_catalog_item_to_queue(artist: str, title: str, dj: str, content_type: st
         "folder_path": str(folder_path),
         "regenerate_type": regen_type,
         "feedback": "",
-        "added_at": datetime.now().isoformat(),
+        "added_at": datetime.now(),
         "source": "catalog"
     }
     
-    queue.append(queue_item)
-    REGEN_QUEUE_FILE.write_text(json.dumps(queue, indent=2), encoding='utf-8')
+    _append_regen_queue(queue_item)
     logger.info(f"Added to queue: {artist} - {title} ({content_type}/{dj}/{regen_type})")
     return True
 
 
+def get_queued_keys() -> set:
+    """Get the session's set of (item_id, dj, content_type) keys already in the queue.
+    
+    Loaded from disk once per session so repeat "Queue" clicks on the same
+    song are rejected without re-reading the queue file. Call
+    reset_queued_keys() whenever the queue is cleared or processed, and
+    sync_queue_count() before trusting a hit, since the CLI processor or
+    another session may have consumed the queue since it was loaded.
+    """
+    if '_queued_keys' not in st.session_state:
+        st.session_state._queued_keys = {
+            (q.get("item_id"), q.get("dj"), q.get("content_type"))
+            for q in _read_regen_queue()
+        }
+    return st.session_state._queued_keys
+
+
+def reset_queued_keys():
+    """Drop the session's queued-keys set so it is reloaded from disk."""
+    st.session_state.pop('_queued_keys', None)
+
+
+def sync_queue_count():
+    """Re-read the queue length, dropping the queued-keys set if it changed.
+    
+    A count that differs from the session's means the queue was changed
+    outside this session (e.g. consumed by the CLI processor), so the set
+    may hold songs that are no longer queued.
+    """
+    count = get_regen_queue_count()
+    if st.session_state.get('queue_count') != count:
+        reset_queued_keys()
+    st.session_state.queue_count = count
+
+
+def clear_queue_and_results():
+    """on_click callback for Clear Queue; runs before the sidebar rerenders."""
+    clear_regen_queue()
+    reset_queued_keys()
+    clear_queue_results()
+
+
+def clear_queue_results():
+    """on_click callback that dismisses the last queue run's results."""
+    st.session_state.queue_results = None
+
+
+def refresh_content():
+    """on_click callback for Refresh; forces a rescan even if the fingerprint is unchanged."""
+    _get_song_content_cached.clear()
+    content_scan().invalidate()
+    # Also pick up queue changes made outside this session (e.g. the CLI processor)
+    sync_queue_count()
+
+
 def process_regeneration_queue(progress_callback=None, status_callback=None):
     """
     Process items in the regeneration queue with progress tracking.
@@ -570,14 +1284,7 @@ def process_regeneration_queue(progress_callback=None, status_callback=None):
     Returns:
         Dict with results: {"success_count": int, "failed_count": int, "errors": List[str]}
     """
-    if not REGEN_QUEUE_FILE.exists():
-        return {"success_count": 0, "failed_count": 0, "errors": []}
-    
-    try:
-        queue = json.loads(REGEN_QUEUE_FILE.read_text(encoding='utf-8'))
-    except Exception as e:
-        return {"success_count": 0, "failed_count": 0, "errors": [f"Failed to read queue: {str(e)}"]}
-    
+    queue = _read_regen_queue()
     if not queue:
         return {"success_count": 0, "failed_count": 0, "errors": []}
     
@@ -640,36 +1347,34 @@ def process_regeneration_queue(progress_callback=None, status_callback=None):
     if status_callback:
         status_callback(f"Complete! {results['success_count']} succeeded, {results['failed_count']} failed")
     
-    # Clear queue after processing
-    clear_regen_queue()
+    # Drop the processed entries (anything queued meanwhile stays)
+    consume_regen_queue(total_items)
     
     return results
 
 
 def _get_next_version_for_regen(folder_path: Path, dj: str, content_type: str) -> int:
     """Get next version number for regeneration."""
-    if content_type == "outros":
-        existing_files = list(folder_path.glob(f"{dj}_outro*.txt")) + list(folder_path.glob(f"{dj}_outro*.wav"))
-    else:
-        existing_files = list(folder_path.glob(f"{dj}_*.txt")) + list(folder_path.glob(f"{dj}_*.wav"))
+    prefix = f"{dj}_outro" if content_type == "outros" else f"{dj}_"
+    # One listing covers both the .txt and .wav versions
+    try:
+        with os.scandir(folder_path) as entries:
+            existing_stems = [entry.name[:-4] for entry in entries
+                              if entry.name.startswith(prefix) and entry.name.endswith(('.txt', '.wav'))]
+    except FileNotFoundError:
+        return 0
     
-    if not existing_files:
+    if not existing_stems:
         return 0
     
     # Extract version numbers
     versions = []
-    for f in existing_files:
-        if content_type == "outros":
-            if f.stem == f"{dj}_outro":
-                versions.append(0)
-            else:
-                match = re.search(r'_outro_(\d+)', f.stem)
-                if match:
-                    versions.append(int(match.group(1)))
-        else:
-            match = re.search(rf'{dj}_(\d+)', f.stem)
-            if match:
-                versions.append(int(match.group(1)))
+    for stem in existing_stems:
+        match = _VERSION_SUFFIX_RE.search(stem)
+        if match:
+            versions.append(int(match.group(1)))
+        elif content_type == "outros":
+            versions.append(0)  # julie_outro / julie_outro_full: unnumbered version 0
     
     return max(versions) + 1 if versions else 0
 
@@ -872,46 +1577,132 @@ def _generate_weather(pipeline, dj, hour: int, minute: int, regen_type: str, fee
         return False, error_msg
 
 
-def export_reviews_to_csv(items: List[ReviewItem]) -> pd.DataFrame:
-    """Export review data to CSV format."""
-    rows = []
+def export_reviews_to_csv(items: List[ReviewItem]) -> str:
+    """Export review data to CSV text (header row + one row per item)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(EXPORT_COLUMNS)
     for item in items:
-        review_status = load_review_status(item.folder_path)
-        rows.append({
-            "content_type": item.content_type,
-            "dj": item.dj,
-            "item_id": item.item_id,
-            "latest_version": item.latest_version,
-            "audit_status": item.audit_status or "unknown",
-            "review_status": review_status.get("status", "pending"),
-            "reviewed_at": review_status.get("reviewed_at", ""),
-            "script_issues": ", ".join(review_status.get("script_issues", [])),
-            "audio_issues": ", ".join(review_status.get("audio_issues", [])),
-            "reviewer_notes": review_status.get("reviewer_notes", "")
-        })
-    return pd.DataFrame(rows)
+        review_status = item.review_status_data
+        writer.writerow([
+            item.content_type,
+            item.dj,
+            item.item_id,
+            item.latest_version,
+            item.audit_status or "unknown",
+            review_status.get("status", "pending"),
+            review_status.get("reviewed_at", ""),
+            ", ".join(review_status.get("script_issues", [])),
+            ", ".join(review_status.get("audio_issues", [])),
+            review_status.get("reviewer_notes", ""),
+        ])
+    return buf.getvalue()
+
+
+def export_signature(items: List[ReviewItem]) -> tuple:
+    """Identify an export's contents: which items, and when each was reviewed."""
+    return tuple((str(i.folder_path), i.review_status_data.get("reviewed_at")) for i in items)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _read_text(path: str, mtime_ns: int, size: int) -> str:
+    """Read a text file; cached per (path, mtime, size) so reruns skip the disk.
+    
+    Size is part of the key because an edit saved within the filesystem's
+    mtime granularity (1-2s on some mounts) can leave the mtime unchanged.
+    """
+    text = read_file_bytes(path).decode('utf-8')
+    # Same newline translation read_text does (scripts may be saved on Windows)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def read_script_text(path: Path) -> Optional[str]:
+    """Read a script (or backup) file through the stat-keyed text cache.
+    
+    Returns None if the file no longer exists.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return _read_text(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def render_audio_player(audio_path: Path, key_suffix: str = ""):
-    """Render HTML5 audio player for a wav file with mobile-friendly styling."""
-    if audio_path and audio_path.exists():
-        audio_bytes = audio_path.read_bytes()
-        audio_b64 = base64.b64encode(audio_bytes).decode()
-        # Mobile-optimized audio player - no background wrapper to respect theme
-        audio_html = f"""
-        <audio controls style="width: 100%; min-height: 54px; border-radius: 12px; margin: 8px 0;">
-            <source src="data:audio/wav;base64,{audio_b64}" type="audio/wav">
-            Your browser does not support the audio element.
-        </audio>
-        """
-        st.markdown(audio_html, unsafe_allow_html=True)
-    else:
-        st.warning("🔇 Audio file not found")
+    """Render an audio player for a wav file.
+    
+    st.audio serves the file through Streamlit's media endpoint, so only a URL
+    goes over the websocket instead of the base64-encoded WAV.
+    
+    Paths come from the content scan, so there is no exists() probe here; a
+    file deleted since the scan (st.audio raises MediaFileStorageError for
+    it, not OSError) surfaces as the same "not found" warning.
+    """
+    if audio_path:
+        try:
+            st.audio(str(audio_path), format="audio/wav")
+            return
+        except (MediaFileStorageError, OSError):
+            pass
+    st.warning("🔇 Audio file not found")
+
+
+def render_page_indicator(placeholder, current_page: int, total_pages: int):
+    """Fill a reserved st.empty() slot with the "page / total" indicator.
+    
+    Callers reserve the slot while laying out the nav row and fill it once
+    the page buttons have been handled, so the indicator is written once per
+    run with the final page number.
+    """
+    placeholder.markdown(
+        f'<div style="{PAGE_INDICATOR_STYLE}"><strong>{current_page + 1}</strong> / {total_pages}</div>',
+        unsafe_allow_html=True
+    )
+
+
+def step_page(step: int):
+    """on_click callback for Prev/Next; runs before the review tab reruns."""
+    st.session_state.current_page += step
+
+
+def jump_to_page():
+    """on_click callback for the page jump; the input holds a 1-based page."""
+    st.session_state.current_page = st.session_state.jump_page - 1
+
 
+def step_catalog_page(step: int):
+    """on_click callback for the catalog's Prev/Next arrows."""
+    st.session_state.catalog_page += step
 
+
+def step_version(version_key: str, step: int):
+    """on_click callback for the version arrows; runs before the fragment reruns."""
+    st.session_state[version_key] += step
+
+
+def keep_widget_state(*keys: str):
+    """Carry widget values through a run that doesn't draw their widgets.
+    
+    Streamlit drops a widget's value after any run it isn't rendered in, so
+    choices inside a collapsed lazy expander would reset when it reopens.
+    Re-assigning the value makes it plain session state, which is kept.
+    """
+    for key in keys:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+
+
+@st.fragment
 def render_review_item(item: ReviewItem, index: int):
-    """Render a single review item with mobile-first design."""
-    review_status = load_review_status(item.folder_path)
+    """Render a single review item with mobile-first design.
+    
+    Runs as a fragment: version navigation and edits to the issue pickers or
+    notes rerun only this item. Actions that change the queue or review
+    status rerun the whole app so the sidebar and metrics stay current.
+    """
+    review_status = item.review_status_data
     
     # Use Streamlit container instead of custom div for theme compatibility
     with st.container():
@@ -960,9 +1751,8 @@ def render_review_item(item: ReviewItem, index: int):
         # Navigation row: < version N of M >
         nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
         with nav_col1:
-            if st.button("◀️", key=f"prev_ver_{index}", disabled=(version == 0), use_container_width=True):
-                st.session_state[version_key] = version - 1
-                st.rerun()
+            st.button("◀️", key=f"prev_ver_{index}", disabled=(version == 0), use_container_width=True,
+                      on_click=step_version, args=(version_key, -1))
         with nav_col2:
             st.markdown(f"""
             <div style="text-align: center; padding: 8px; background: rgba(128,128,128,0.1); border-radius: 8px;">
@@ -970,19 +1760,23 @@ def render_review_item(item: ReviewItem, index: int):
             </div>
             """, unsafe_allow_html=True)
         with nav_col3:
-            if st.button("▶️", key=f"next_ver_{index}", disabled=(version >= item.latest_version), use_container_width=True):
-                st.session_state[version_key] = version + 1
-                st.rerun()
+            st.button("▶️", key=f"next_ver_{index}", disabled=(version >= item.latest_version), use_container_width=True,
+                      on_click=step_version, args=(version_key, 1))
     else:
         version = 0  # Only one version exists, no navigation needed
     
-    # Check for dual audio
+    # Check for dual audio - a radio rather than st.tabs, which would load
+    # (and have Streamlit hash) both WAVs on every run
     if item.has_dual_audio(version):
-        audio_tab1, audio_tab2 = st.tabs(["📻 30sec", "📻 Full"])
-        with audio_tab1:
-            render_audio_player(item.get_audio_path(version, ref_type='30sec'), f"30sec_{index}")
-        with audio_tab2:
-            render_audio_player(item.get_audio_path(version, ref_type='full'), f"full_{index}")
+        ref_type = st.radio(
+            "Reference audio",
+            list(AUDIO_REF_TABS),
+            format_func=AUDIO_REF_TABS.get,
+            key=f"audio_ref_{index}",
+            horizontal=True,
+            label_visibility="collapsed"
+        )
+        render_audio_player(item.get_audio_path(version, ref_type=ref_type), f"{ref_type}_{index}")
     else:
         audio_path = item.get_audio_path(version)
         render_audio_player(audio_path, f"main_{index}")
@@ -992,9 +1786,9 @@ def render_review_item(item: ReviewItem, index: int):
         script_path = item.get_script_path(version)
         current_script = ""
         
-        if script_path and script_path.exists():
+        if script_path:
             if f"{item.dj}_" in script_path.name or f"{item.dj}_outro" in script_path.name:
-                current_script = script_path.read_text(encoding='utf-8')
+                current_script = read_script_text(script_path) or ""
             else:
                 st.error(f"⚠️ Script file mismatch!")
                 current_script = f"ERROR: File mismatch"
@@ -1017,140 +1811,138 @@ def render_review_item(item: ReviewItem, index: int):
                 # Auto-save the changes immediately
                 if save_manual_script(item, edited_script, version):
                     st.toast("✅ Auto-saved!", icon="💾")
-                    st.rerun()
+                    st.rerun(scope="app")
         else:
             st.warning("No script file found")
     
     # === ORIGINAL SCRIPT COMPARISON (Collapsible - like lyrics) ===
-    with st.expander("🔄 Compare with Original/Previous Versions", expanded=False):
-        # Get backup file (original before any edits)
-        # The backup is stored as script_name.txt.original (not .original replacing .txt)
-        script_path = item.get_script_path(version)
-        has_original_backup = False
-        original_script = ""
-        
-        if script_path and script_path.exists():
-            # Try both naming conventions for backup
-            backup_path = Path(str(script_path) + '.original')  # e.g., julie_0.txt.original
-            if not backup_path.exists():
-                backup_path = script_path.with_suffix('.original')  # e.g., julie_0.original
+    # Diffs and backup reads only run while the expander is open
+    compare_expander = st.expander("🔄 Compare with Original/Previous Versions",
+                                   key=f"compare_exp_{index}", on_change="rerun")
+    if compare_expander.open:
+        with compare_expander:
+            # Get backup file (original before any edits), recorded by the scan under
+            # either naming convention: julie_0.txt.original or julie_0.original
+            backup_path = item.get_backup_path(version)
+            original_script = read_script_text(backup_path) if backup_path else None
+            has_original_backup = original_script is not None
             
-            if backup_path.exists():
-                has_original_backup = True
-                original_script = backup_path.read_text(encoding='utf-8')
-        
-        if has_original_backup:
-            st.markdown("**📄 Original (before any manual edits):**")
-            st.text_area(
-                "Original script",
-                value=original_script,
-                height=150,
-                disabled=True,
-                key=f"orig_{index}_{version}",
-                label_visibility="collapsed"
-            )
+            if has_original_backup:
+                st.markdown("**📄 Original (before any manual edits):**")
+                st.text_area(
+                    "Original script",
+                    value=original_script,
+                    height=150,
+                    disabled=True,
+                    key=f"orig_{index}_{version}",
+                    label_visibility="collapsed"
+                )
+                
+                # Show edit stats
+                edit_count = review_status.get("edit_count", 0)
+                if edit_count > 0:
+                    first_edit = review_status.get("original_backup_at", "")
+                    last_edit = review_status.get("rewritten_at", "")
+                    st.caption(f"📝 Edited {edit_count} time(s)")
+                    if first_edit:
+                        st.caption(f"First edit: {first_edit[:19]}")
+                    if last_edit and last_edit != first_edit:
+                        st.caption(f"Last edit: {last_edit[:19]}")
+            elif is_rewritten:
+                # Edited but no backup exists (legacy edits before backup feature)
+                st.warning("⚠️ This script was edited before the backup feature was added. Original content is not available.")
+                st.caption("Future edits will create a backup of the current version.")
             
-            # Show edit stats
-            edit_count = review_status.get("edit_count", 0)
-            if edit_count > 0:
-                first_edit = review_status.get("original_backup_at", "")
-                last_edit = review_status.get("rewritten_at", "")
-                st.caption(f"📝 Edited {edit_count} time(s)")
-                if first_edit:
-                    st.caption(f"First edit: {first_edit[:19]}")
-                if last_edit and last_edit != first_edit:
-                    st.caption(f"Last edit: {last_edit[:19]}")
-        elif is_rewritten:
-            # Edited but no backup exists (legacy edits before backup feature)
-            st.warning("⚠️ This script was edited before the backup feature was added. Original content is not available.")
-            st.caption("Future edits will create a backup of the current version.")
-        
-        st.markdown("---")
-        
-        # Version comparison with selector - now with color-coded diff
-        st.markdown("**📚 Compare with other versions (color-coded diff):**")
-        
-        # Build list of available versions to compare
-        available_versions = []
-        for v in range(item.latest_version + 1):
-            v_path = item.get_script_path(v)
-            if v_path and v_path.exists():
-                label = f"Version {v}"
-                if v == version:
-                    label += " (current)"
-                if v == item.latest_version:
-                    label += " (latest)"
-                available_versions.append((v, label))
-        
-        if len(available_versions) > 1:
-            # Filter out current version for comparison
-            compare_options = [(v, label) for v, label in available_versions if v != version]
+            st.markdown("---")
             
-            if compare_options:
-                compare_version = st.selectbox(
-                    "Select version to compare:",
-                    options=[v for v, _ in compare_options],
-                    format_func=lambda x: next(label for v, label in compare_options if v == x),
-                    key=f"compare_select_{index}"
-                )
+            # Version comparison with selector - now with color-coded diff
+            st.markdown("**📚 Compare with other versions (color-coded diff):**")
+            
+            # Build list of available versions to compare
+            available_versions = []
+            for v in range(item.latest_version + 1):
+                v_path = item.get_script_path(v)
+                if v_path:
+                    label = f"Version {v}"
+                    if v == version:
+                        label += " (current)"
+                    if v == item.latest_version:
+                        label += " (latest)"
+                    available_versions.append((v, label))
+            
+            if len(available_versions) > 1:
+                # Filter out current version for comparison
+                compare_options = [(v, label) for v, label in available_versions if v != version]
                 
-                compare_path = item.get_script_path(compare_version)
-                if compare_path and compare_path.exists():
-                    compare_script = compare_path.read_text(encoding='utf-8')
-                    
-                    # Show diff rendering toggle
-                    diff_mode = st.radio(
-                        "View mode:",
-                        ["Side-by-side text", "Color diff (inline)", "Color diff (table)"],
-                        horizontal=True,
-                        key=f"diff_mode_{index}",
-                        label_visibility="collapsed"
+                if compare_options:
+                    compare_version = st.selectbox(
+                        "Select version to compare:",
+                        options=[v for v, _ in compare_options],
+                        format_func=lambda x: next(label for v, label in compare_options if v == x),
+                        key=f"compare_select_{index}"
                     )
                     
-                    if diff_mode == "Side-by-side text":
-                        # Original plain text comparison
-                        col_old, col_new = st.columns(2)
-                        with col_old:
-                            st.caption(f"Version {compare_version}")
-                            st.text_area(
-                                f"Version {compare_version}",
-                                value=compare_script,
-                                height=150,
-                                disabled=True,
-                                key=f"compare_{index}_{compare_version}",
-                                label_visibility="collapsed"
-                            )
-                        with col_new:
-                            st.caption(f"Version {version} (current)")
-                            st.text_area(
-                                f"Version {version}",
-                                value=current_script,
-                                height=150,
-                                disabled=True,
-                                key=f"current_{index}_{version}_cmp",
-                                label_visibility="collapsed"
-                            )
-                    elif diff_mode == "Color diff (inline)":
-                        # Use inline diff rendering (mobile-friendly)
-                        diff_html = render_inline_diff(compare_script, current_script)
-                        st.markdown(diff_html, unsafe_allow_html=True)
-                    else:
-                        # Use table diff rendering
-                        diff_html = render_diff(compare_script, current_script)
-                        st.markdown(f'<div style="overflow-x: auto; font-size: 0.85rem;">{diff_html}</div>', unsafe_allow_html=True)
-        else:
-            st.caption("No other versions available for comparison")
+                    compare_path = item.get_script_path(compare_version)
+                    compare_script = read_script_text(compare_path) if compare_path else None
+                    if compare_script is not None:
+                        
+                        # Show diff rendering toggle
+                        diff_mode = st.radio(
+                            "View mode:",
+                            ["Side-by-side text", "Color diff (inline)", "Color diff (table)"],
+                            horizontal=True,
+                            key=f"diff_mode_{index}",
+                            label_visibility="collapsed"
+                        )
+                        
+                        if diff_mode == "Side-by-side text":
+                            # Original plain text comparison
+                            col_old, col_new = st.columns(2)
+                            with col_old:
+                                st.caption(f"Version {compare_version}")
+                                st.text_area(
+                                    f"Version {compare_version}",
+                                    value=compare_script,
+                                    height=150,
+                                    disabled=True,
+                                    key=f"compare_{index}_{compare_version}",
+                                    label_visibility="collapsed"
+                                )
+                            with col_new:
+                                st.caption(f"Version {version} (current)")
+                                st.text_area(
+                                    f"Version {version}",
+                                    value=current_script,
+                                    height=150,
+                                    disabled=True,
+                                    key=f"current_{index}_{version}_cmp",
+                                    label_visibility="collapsed"
+                                )
+                        elif diff_mode == "Color diff (inline)":
+                            # Use inline diff rendering (mobile-friendly)
+                            diff_html = render_inline_diff(compare_script, current_script)
+                            st.markdown(diff_html, unsafe_allow_html=True)
+                        else:
+                            # Use table diff rendering
+                            diff_html = render_diff(compare_script, current_script)
+                            st.markdown(f'<div style="overflow-x: auto; font-size: 0.85rem;">{diff_html}</div>', unsafe_allow_html=True)
+            else:
+                st.caption("No other versions available for comparison")
+    else:
+        keep_widget_state(f"compare_select_{index}", f"diff_mode_{index}")
     
     # === REFERENCE MATERIALS (Collapsed by default on mobile) ===
     if item.content_type in ["intros", "outros"]:
-        with st.expander("📜 Song Lyrics", expanded=False):
-            lyrics_file = find_lyrics_file(item.item_id)
-            if lyrics_file:
-                lyrics = load_lyrics(lyrics_file)
-                st.text_area("Lyrics", value=lyrics, height=150, disabled=True, 
-                           key=f"lyrics_{index}_{version}", label_visibility="collapsed")
-            else:
-                st.info("No lyrics file found")
+        lyrics_expander = st.expander("📜 Song Lyrics", key=f"lyrics_exp_{index}", on_change="rerun")
+        if lyrics_expander.open:
+            with lyrics_expander:
+                lyrics_file = find_lyrics_file(item.item_id)
+                if lyrics_file:
+                    lyrics = load_lyrics(lyrics_file)
+                    st.text_area("Lyrics", value=lyrics, height=150, disabled=True, 
+                               key=f"lyrics_{index}_{version}", label_visibility="collapsed")
+                else:
+                    st.info("No lyrics file found")
     
     # === QUICK ACTIONS (Prominent for mobile) ===
     st.markdown("#### ⚡ Quick Actions")
@@ -1161,17 +1953,17 @@ def render_review_item(item: ReviewItem, index: int):
         if st.button("📝 Regen Script", key=f"regen_s_{index}", use_container_width=True):
             add_to_regen_queue(item, "script", "Quick regen from review")
             st.toast("Added to queue!", icon="✅")
-            st.rerun()
+            st.rerun(scope="app")
     with regen_cols[1]:
         if st.button("🔊 Regen Audio", key=f"regen_a_{index}", use_container_width=True):
             add_to_regen_queue(item, "audio", "Quick regen from review")
             st.toast("Added to queue!", icon="✅")
-            st.rerun()
+            st.rerun(scope="app")
     with regen_cols[2]:
         if st.button("🔄 Regen Both", key=f"regen_b_{index}", use_container_width=True):
             add_to_regen_queue(item, "both", "Quick regen from review")
             st.toast("Added to queue!", icon="✅")
-            st.rerun()
+            st.rerun(scope="app")
     
     # === REGENERATE AUDIO FROM CURRENT SCRIPT (for manual edits) ===
     # Check if script was manually edited
@@ -1189,7 +1981,7 @@ def render_review_item(item: ReviewItem, index: int):
             # Add to queue with audio-only regeneration
             add_to_regen_queue(item, "audio", "Audio from manual edit - no script validation")
             st.toast("Added to queue! Audio will be generated from current script.", icon="🎤")
-            st.rerun()
+            st.rerun(scope="app")
     
     # === REVIEW DECISION (Most important - always visible) ===
     st.markdown("---")
@@ -1199,7 +1991,7 @@ def render_review_item(item: ReviewItem, index: int):
     issue_tab1, issue_tab2 = st.tabs(["Script Issues", "Audio Issues"])
     
     with issue_tab1:
-        script_issue_options = SCRIPT_ISSUES.get(item.content_type, [])
+        script_issue_options = SCRIPT_ISSUES.get(item.content_type, ())
         selected_script_issues = st.multiselect(
             "Select script issues",
             script_issue_options,
@@ -1246,7 +2038,7 @@ def render_review_item(item: ReviewItem, index: int):
                 new_status["edit_count"] = review_status.get("edit_count", 1)
             save_review_status(item.folder_path, new_status)
             st.success("✅ Approved!")
-            st.rerun()
+            st.rerun(scope="app")
     
     with reject_col:
         if st.button("❌ REJECT", key=f"reject_{index}", use_container_width=True):
@@ -1263,7 +2055,7 @@ def render_review_item(item: ReviewItem, index: int):
                 new_status["edit_count"] = review_status.get("edit_count", 1)
             save_review_status(item.folder_path, new_status)
             st.error("❌ Rejected")
-            st.rerun()
+            st.rerun(scope="app")
 
 
 def find_lyrics_file(song_id: str) -> Optional[Path]:
@@ -1289,17 +2081,6 @@ def find_lyrics_file(song_id: str) -> Optional[Path]:
         text = text.replace('_', ' ')
         return text
     
-    def normalize_for_matching(text: str) -> str:
-        """Normalize text for fuzzy matching."""
-        # Remove all quotes and apostrophes
-        text = text.replace('"', '').replace('"', '').replace('"', '')
-        text = text.replace("'", '').replace("'", '').replace("'", '')
-        # Remove other special chars except spaces
-        text = re.sub(r'[^a-z0-9\s]', '', text.lower())
-        # Remove all spaces for matching (handles "I m" vs "Im" issue)
-        text = text.replace(' ', '')
-        return text
-    
     artist_part = folder_to_display(parts[0])
     title_part = folder_to_display(parts[1])
     
@@ -1310,12 +2091,36 @@ def find_lyrics_file(song_id: str) -> Optional[Path]:
         return lyrics_path
     
     # Try normalized matching (removes all spaces, quotes, apostrophes)
-    expected_normalized = normalize_for_matching(f"{title_part} by {artist_part}")
-    for lyrics_file in LYRICS_DIR.glob("*.txt"):
-        if normalize_for_matching(lyrics_file.stem) == expected_normalized:
-            return lyrics_file
+    expected_normalized = _normalize_lyrics_name(f"{title_part} by {artist_part}")
+    name = _lyrics_name_index(str(LYRICS_DIR), LYRICS_DIR.stat().st_mtime_ns).get(expected_normalized)
+    return LYRICS_DIR / name if name else None
+
+
+def _normalize_lyrics_name(text: str) -> str:
+    """Normalize a song name for fuzzy lyrics-file matching."""
+    # Remove all quotes and apostrophes
+    text = text.replace('"', '').replace('"', '').replace('"', '')
+    text = text.replace("'", '').replace("'", '').replace("'", '')
+    # Remove other special chars except spaces
+    text = _NON_ALNUM_RE.sub('', text.lower())
+    # Remove all spaces for matching (handles "I m" vs "Im" issue)
+    text = text.replace(' ', '')
+    return text
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _lyrics_name_index(lyrics_dir: str, mtime_ns: int) -> Dict[str, str]:
+    """Normalized name -> lyrics file name, built once per directory mtime.
     
-    return None
+    Saves re-listing and re-normalizing the whole lyrics folder for every
+    song item rendered. The arguments are only the cache key.
+    """
+    index = {}
+    with os.scandir(lyrics_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".txt"):
+                index.setdefault(_normalize_lyrics_name(entry.name[:-4]), entry.name)
+    return index
 
 
 def format_song_title(item_id: str) -> tuple[str, str]:
@@ -1348,13 +2153,13 @@ def format_song_title(item_id: str) -> tuple[str, str]:
         
         # Detect nickname pattern: Name__Nickname__Surname
         # E.g., Arthur__Big_Boy__Crudup -> Arthur "Big Boy" Crudup
-        text = re.sub(r'([A-Z][a-z]+)__([A-Z][a-z]+(?:_[A-Z][a-z]+)?)__([A-Z][a-z]+)', 
-                      lambda m: m.group(1) + ' "' + m.group(2).replace('_', ' ') + '" ' + m.group(3), 
-                      text)
+        text = _NICKNAME_RE.sub(
+            lambda m: m.group(1) + ' "' + m.group(2).replace('_', ' ') + '" ' + m.group(3),
+            text)
         
         # Handle common apostrophe patterns: _m -> 'm, _s -> 's, _t -> 't, etc.
-        text = re.sub(r"_([mstMST])(?=_|$)", r"'\1", text)
-        text = re.sub(r"_(ll|re|ve|d)(?=_|$)", r"'\1", text)
+        text = _SHORT_CONTRACTION_RE.sub(r"'\1", text)
+        text = _LONG_CONTRACTION_RE.sub(r"'\1", text)
         
         # Double underscore that remains = just a space (phrase separator)
         text = text.replace('__', ' ')
@@ -1363,7 +2168,7 @@ def format_song_title(item_id: str) -> tuple[str, str]:
         text = text.replace('_', ' ')
         
         # Clean up any double spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         return text
     
     artist_part = folder_to_display(parts[0])
@@ -1374,134 +2179,88 @@ def format_song_title(item_id: str) -> tuple[str, str]:
 
 
 def get_available_songs() -> List[Dict[str, str]]:
-    """Get list of available songs from lyrics directory."""
-    songs = []
-    if not LYRICS_DIR.exists():
-        return songs
+    """Get list of available songs from lyrics directory.
     
-    for lyrics_file in LYRICS_DIR.glob("*.txt"):
-        # Parse filename: "Title by Artist.txt"
-        filename = lyrics_file.stem
-        match = re.match(r"(.+?)\s+by\s+(.+)", filename)
-        if match:
-            title, artist = match.groups()
-            # Create ID matching generated content naming
-            song_id = f"{artist.replace(' ', '_')}-{title.replace(' ', '_')}"
-            songs.append({
-                "id": song_id,
-                "title": title,
-                "artist": artist,
-                "lyrics_file": lyrics_file
-            })
+    Cached on the directory's mtime, which changes whenever a lyrics file is
+    added, removed or renamed.
+    """
+    try:
+        mtime_ns = LYRICS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return _get_available_songs_cached(str(LYRICS_DIR), mtime_ns)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _get_available_songs_cached(lyrics_dir: str, mtime_ns: int) -> List[Dict[str, str]]:
+    """Cached wrapper; the arguments are only the cache key."""
+    songs = []
+    with os.scandir(lyrics_dir) as entries:
+        for entry in entries:
+            # Parse filename: "Title by Artist.txt"
+            if not entry.name.endswith(".txt"):
+                continue
+            match = _SONG_FILE_RE.match(entry.name[:-4])
+            if match:
+                title, artist = match.groups()
+                # Create ID matching generated content naming
+                song_id = f"{artist}-{title}".translate(_SPACE_TO_UNDERSCORE)
+                songs.append({
+                    "id": song_id,
+                    "title": title,
+                    "artist": artist,
+                    "lyrics_file": Path(entry.path)
+                })
     
     return sorted(songs, key=lambda x: f"{x['artist']} - {x['title']}")
 
 
 def load_lyrics(lyrics_file: Path) -> str:
-    """Load lyrics from file."""
+    """Load lyrics from file (through the same stat-keyed cache as scripts)."""
     try:
-        return lyrics_file.read_text(encoding='utf-8')
+        stat = lyrics_file.stat()
+        return _read_text(str(lyrics_file), stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         return f"Error loading lyrics: {e}"
 
 
 def get_song_content(song_id: str) -> Dict[str, List[ReviewItem]]:
-    """Get all intros and outros for a specific song."""
+    """Get all intros and outros for a specific song.
+    
+    Each candidate folder is scanned the same way as the review list (one
+    os.scandir pass), rather than probing numbered file names. Results are
+    cached on the candidate folders' mtimes, which change whenever a version
+    or review status file is written, and on the audit directories' mtimes.
+    """
+    stamps = []
+    for content_type in ("intros", "outros"):
+        for dj in DJS:
+            for dj_dir in _dj_dirs(content_type, dj):
+                try:
+                    stamps.append(os.stat(dj_dir / song_id).st_mtime_ns)
+                except FileNotFoundError:
+                    stamps.append(None)
+    return _get_song_content_cached(str(GENERATED_DIR), song_id, tuple(stamps), _audit_stamps())
+
+
+@st.cache_data(show_spinner=False, max_entries=64, ttl=SCAN_TTL)
+def _get_song_content_cached(generated_dir: str, song_id: str, stamps: tuple,
+                             audit_stamps: tuple) -> Dict[str, List[ReviewItem]]:
+    """Cached wrapper; the arguments other than song_id are only the cache key."""
     content = {"intros": [], "outros": []}
+    audit_index, status_memo = _scan_caches()
     
     for content_type in ["intros", "outros"]:
         for dj in DJS:
             # Check both legacy doubled path and new single path
-            possible_folders = [
-                GENERATED_DIR / content_type / content_type / dj / song_id,  # Legacy doubled path
-                GENERATED_DIR / content_type / dj / song_id,                  # New single path
-            ]
-            
-            for folder in possible_folders:
-                if not folder.exists():
-                    continue
-                    
-                # Scan for versions
-                script_versions = []
-                audio_versions = []
-                audio_30sec = {}
-                audio_full = {}
-                
-                if content_type == "outros":
-                    # Outros use different naming: dj_outro.txt, dj_outro_1.txt, etc.
-                    base_script = folder / f"{dj}_outro.txt"
-                    base_audio = folder / f"{dj}_outro.wav"
-                    base_audio_full = folder / f"{dj}_outro_full.wav"
-                    base_audio_30sec = folder / f"{dj}_outro_30sec.wav"
-                    if base_script.exists():
-                        script_versions.append(base_script)
-                    if base_audio.exists():
-                        audio_versions.append(base_audio)
-                    if base_audio_full.exists():
-                        audio_full[0] = base_audio_full
-                    if base_audio_30sec.exists():
-                        audio_30sec[0] = base_audio_30sec
-                    
-                    # Check for numbered versions
-                    for i in range(1, 100):
-                        script = folder / f"{dj}_outro_{i}.txt"
-                        audio = folder / f"{dj}_outro_{i}.wav"
-                        audio_f = folder / f"{dj}_outro_{i}_full.wav"
-                        audio_30 = folder / f"{dj}_outro_{i}_30sec.wav"
-                        if script.exists():
-                            script_versions.append(script)
-                        if audio.exists():
-                            audio_versions.append(audio)
-                        if audio_f.exists():
-                            audio_full[i] = audio_f
-                        if audio_30.exists():
-                            audio_30sec[i] = audio_30
-                        if not script.exists() and not audio.exists() and not audio_f.exists() and not audio_30.exists():
-                            break
-                else:
-                    # Standard naming: dj_0.txt, dj_1.txt, dj_0_full.wav, dj_0_30sec.wav, etc.
-                    for i in range(100):
-                        script = folder / f"{dj}_{i}.txt"
-                        audio = folder / f"{dj}_{i}.wav"
-                        audio_f = folder / f"{dj}_{i}_full.wav"
-                        audio_30 = folder / f"{dj}_{i}_30sec.wav"
-                        if script.exists():
-                            script_versions.append(script)
-                        if audio.exists():
-                            audio_versions.append(audio)
-                            # Store legacy audio in audio_full for backwards compatibility
-                            if i not in audio_full:
-                                audio_full[i] = audio
-                        if audio_f.exists():
-                            audio_full[i] = audio_f
-                        if audio_30.exists():
-                            audio_30sec[i] = audio_30
-                        if not script.exists() and not audio.exists() and not audio_f.exists() and not audio_30.exists():
-                            break
+            for dj_dir in _dj_dirs(content_type, dj):
+                folder = dj_dir / song_id
+                try:
+                    item = _build_review_item(content_type, dj, song_id, folder, False, audit_index, status_memo)
+                except OSError:
+                    continue  # No folder under this path structure
                 
-                if script_versions or audio_versions or audio_full or audio_30sec:
-                    latest = max(
-                        len(script_versions) - 1 if script_versions else 0,
-                        len(audio_versions) - 1 if audio_versions else 0,
-                        max(audio_full.keys()) if audio_full else 0,
-                        max(audio_30sec.keys()) if audio_30sec else 0
-                    )
-                    review_status_data = load_review_status(folder)
-                    audit_status = get_audit_status(content_type, dj, song_id)
-                    
-                    item = ReviewItem(
-                        content_type=content_type,
-                        dj=dj,
-                        item_id=song_id,
-                        folder_path=folder,
-                        script_versions=script_versions,
-                        audio_versions=audio_versions,
-                        latest_version=latest,
-                        audit_status=audit_status,
-                        review_status=review_status_data.get("status", "pending"),
-                        audio_30sec=audio_30sec,
-                        audio_full=audio_full
-                    )
+                if item:
                     content[content_type].append(item)
                     break  # Found content in this path, don't check the other
     
@@ -1597,16 +2356,18 @@ def render_song_editor_page():
     st.markdown(f"**Artist:** {selected_song['artist']}")
     st.markdown(f"**Song ID:** `{selected_song['id']}`")
     
-    # Load and display lyrics
-    with st.expander("Song Lyrics", expanded=False):
-        lyrics = load_lyrics(selected_song['lyrics_file'])
-        st.text_area(
-            "Lyrics",
-            value=lyrics,
-            height=300,
-            disabled=True,
-            key=f"lyrics_{selected_song['id']}"
-        )
+    # Load and display lyrics (read only while the expander is open)
+    lyrics_expander = st.expander("Song Lyrics", key=f"lyrics_exp_{selected_song['id']}", on_change="rerun")
+    if lyrics_expander.open:
+        with lyrics_expander:
+            lyrics = load_lyrics(selected_song['lyrics_file'])
+            st.text_area(
+                "Lyrics",
+                value=lyrics,
+                height=300,
+                disabled=True,
+                key=f"lyrics_{selected_song['id']}"
+            )
     
     st.markdown("---")
     
@@ -1647,7 +2408,7 @@ def render_song_content_editor(item: ReviewItem, song_info: Dict, content_label:
         st.markdown(status_html, unsafe_allow_html=True)
         
         # Check if manually rewritten
-        review_status = load_review_status(item.folder_path)
+        review_status = item.review_status_data
         is_rewritten = review_status.get("manually_rewritten", False)
         
         if is_rewritten:
@@ -1668,26 +2429,24 @@ def render_song_content_editor(item: ReviewItem, song_info: Dict, content_label:
         
         # Get script content
         script_path = item.get_script_path(selected_version)
-        current_script = None
-        if script_path and script_path.exists():
-            current_script = script_path.read_text(encoding='utf-8')
+        current_script = read_script_text(script_path) if script_path else None
         
         # === AUDIO FIRST (most important) ===
         st.markdown("#### 🔊 Audio")
         if item.has_dual_audio(selected_version):
-            audio_tab1, audio_tab2 = st.tabs(["30sec", "Full"])
-            with audio_tab1:
-                audio_30sec_path = item.get_audio_path(selected_version, ref_type='30sec')
-                if audio_30sec_path and audio_30sec_path.exists():
-                    st.audio(audio_30sec_path.read_bytes(), format="audio/wav")
-            with audio_tab2:
-                audio_full_path = item.get_audio_path(selected_version, ref_type='full')
-                if audio_full_path and audio_full_path.exists():
-                    st.audio(audio_full_path.read_bytes(), format="audio/wav")
+            ref_type = st.radio(
+                "Reference audio",
+                list(AUDIO_REF_TABS),
+                format_func=AUDIO_REF_TABS.get,
+                key=f"audio_ref_{item.dj}_{item.content_type}_{item.item_id}",
+                horizontal=True,
+                label_visibility="collapsed"
+            )
+            render_audio_player(item.get_audio_path(selected_version, ref_type=ref_type))
         else:
             audio_path = item.get_audio_path(selected_version)
-            if audio_path and audio_path.exists():
-                st.audio(audio_path.read_bytes(), format="audio/wav")
+            if audio_path:
+                render_audio_player(audio_path)
             else:
                 st.info("No audio file")
         
@@ -1722,13 +2481,16 @@ def render_song_content_editor(item: ReviewItem, song_info: Dict, content_label:
         else:
             st.warning(f"Script not found: {script_path}")
         
-        # Reference materials (collapsed)
-        with st.expander("📜 Reference", expanded=False):
-            st.markdown("**Song Lyrics:**")
-            lyrics = load_lyrics(song_info['lyrics_file'])
-            st.text_area("Lyrics", value=lyrics, height=120, disabled=True,
-                       key=f"lyr_{item.dj}_{item.content_type}_{selected_version}",
-                       label_visibility="collapsed")
+        # Reference materials (collapsed; lyrics read only while open)
+        reference_expander = st.expander("📜 Reference", key=f"ref_exp_{item.dj}_{item.content_type}",
+                                         on_change="rerun")
+        if reference_expander.open:
+            with reference_expander:
+                st.markdown("**Song Lyrics:**")
+                lyrics = load_lyrics(song_info['lyrics_file'])
+                st.text_area("Lyrics", value=lyrics, height=120, disabled=True,
+                           key=f"lyr_{item.dj}_{item.content_type}_{selected_version}",
+                           label_visibility="collapsed")
         
         st.markdown("---")
 
@@ -1760,6 +2522,13 @@ def init_session_state():
         st.session_state.catalog_search = ""
     if 'catalog_dj' not in st.session_state:
         st.session_state.catalog_dj = "julie"
+    # Pick up anything left in the pre-JSONL queue file (once per session)
+    if '_regen_queue_migrated' not in st.session_state:
+        migrate_legacy_regen_queue()
+        st.session_state._regen_queue_migrated = True
+    # Queue length for the sidebar; the queue helpers keep it current
+    if 'queue_count' not in st.session_state:
+        st.session_state.queue_count = get_regen_queue_count()
 
 
 def main():
@@ -2046,21 +2815,17 @@ def main():
         st.markdown("### 🔍 Filters")
         
         # Content type filter - using radio for mobile-friendliness
-        content_type_options = ["All"] + CONTENT_TYPES
-        content_type_index = content_type_options.index(st.session_state.filter_content_type) if st.session_state.filter_content_type in content_type_options else 0
         st.session_state.filter_content_type = st.selectbox(
             "📂 Content Type",
-            content_type_options,
-            index=content_type_index
+            CONTENT_TYPE_OPTIONS,
+            index=CONTENT_TYPE_INDEX.get(st.session_state.filter_content_type, 0)
         )
         
         # DJ filter
-        dj_options = ["All"] + DJS
-        dj_index = dj_options.index(st.session_state.filter_dj) if st.session_state.filter_dj in dj_options else 0
         st.session_state.filter_dj = st.selectbox(
             "🎙️ DJ",
-            dj_options,
-            index=dj_index
+            DJ_OPTIONS,
+            index=DJ_INDEX.get(st.session_state.filter_dj, 0)
         )
         
         # Status filters in columns
@@ -2068,14 +2833,14 @@ def main():
         with col_audit:
             st.session_state.filter_audit_status = st.selectbox(
                 "🔍 Audit",
-                ["All", "Passed", "Failed"],
-                index=["All", "Passed", "Failed"].index(st.session_state.filter_audit_status) if st.session_state.filter_audit_status in ["All", "Passed", "Failed"] else 0
+                AUDIT_STATUS_OPTIONS,
+                index=AUDIT_STATUS_INDEX.get(st.session_state.filter_audit_status, 0)
             )
         with col_review:
             st.session_state.filter_review_status = st.selectbox(
                 "📋 Review",
-                ["All", "Pending", "Approved", "Rejected"],
-                index=["All", "Pending", "Approved", "Rejected"].index(st.session_state.filter_review_status) if st.session_state.filter_review_status in ["All", "Pending", "Approved", "Rejected"] else 0
+                REVIEW_STATUS_OPTIONS,
+                index=REVIEW_STATUS_INDEX.get(st.session_state.filter_review_status, 0)
             )
         
         # Search
@@ -2088,14 +2853,14 @@ def main():
         # Items per page - smaller options for mobile
         st.session_state.items_per_page = st.select_slider(
             "Items per page",
-            options=[1, 3, 5, 10, 20],
-            value=st.session_state.items_per_page if st.session_state.items_per_page in [1, 3, 5, 10, 20] else 5
+            options=ITEMS_PER_PAGE_OPTIONS,
+            value=st.session_state.items_per_page if st.session_state.items_per_page in ITEMS_PER_PAGE_OPTIONS else 5
         )
         
         st.markdown("---")
         
         # Queue status - prominent
-        queue_count = get_regen_queue_count()
+        queue_count = st.session_state.queue_count
         if queue_count > 0:
             st.markdown(f"### 🔄 Queue: {queue_count} items")
             if st.button("▶️ Process Queue", use_container_width=True, type="primary"):
@@ -2116,12 +2881,10 @@ def main():
                 
                 # Store results in session state for persistent display
                 st.session_state.queue_results = results
+                reset_queued_keys()
                 st.rerun()
             
-            if st.button("🗑️ Clear Queue", use_container_width=True):
-                clear_regen_queue()
-                st.session_state.queue_results = None
-                st.rerun()
+            st.button("🗑️ Clear Queue", use_container_width=True, on_click=clear_queue_and_results)
         else:
             st.caption("Queue empty")
         
@@ -2135,113 +2898,141 @@ def main():
                 with st.expander("View errors"):
                     for err in results.get("errors", []):
                         st.text(err)
-            if st.button("Clear results", use_container_width=True):
-                st.session_state.queue_results = None
-                st.rerun()
-        
-        # Refresh button
-        if st.button("🔄 Refresh", use_container_width=True):
-            st.rerun()
-    
-    # Tab-based navigation
-    tab_review, tab_catalog = st.tabs(["📋 Review", "🎵 Catalog"])
-    
-    with tab_review:
-        render_review_tab()
+            st.button("Clear results", use_container_width=True, on_click=clear_queue_results)
+        
+        st.button("🔄 Refresh", use_container_width=True, on_click=refresh_content)
+    
+    # Tab-style navigation bound to session state: unlike st.tabs (which
+    # executes every tab body on each rerun), only the active view renders
+    st.radio(
+        "View",
+        list(VIEW_TABS),
+        format_func=VIEW_TABS.get,
+        key="active_tab",
+        horizontal=True,
+        label_visibility="collapsed"
+    )
     
-    with tab_catalog:
+    if st.session_state.active_tab == "Catalog":
         render_catalog_tab()
+    else:
+        render_review_tab()
+
 
+@st.fragment(run_every=1)
+def watch_background_scan():
+    """Poll until the background rescan finishes, then rerun the app."""
+    st.caption("🔄 Content changed - rescanning in the background...")
+    if content_scan().get(_content_fingerprint())[1]:
+        st.rerun()
 
+
+@st.fragment
 def render_review_tab():
-    """Render the review tab content."""
-    # Main content area
-    all_items = scan_generated_content()
-    filtered_items = filter_items(all_items)
+    """Render the review tab content.
+    
+    Runs as a fragment: paging and the export only rerun this tab, not the
+    page styles, header and sidebar. Sidebar filter changes still rerun the
+    whole app (fragments can't draw into the sidebar).
+    """
+    # Main content area - while a rescan runs, show the previous scan
+    (all_items, item_frame), scan_is_current = content_scan().get(_content_fingerprint())
+    if not scan_is_current:
+        watch_background_scan()
+    # Row positions of the matches: ReviewItems are only looked up for the
+    # page being shown, and for the export when one is prepared
+    filtered_rows, status_counts = filter_rows(item_frame)
+    filtered_count = len(filtered_rows)
+    approved_count = int(status_counts.get("approved", 0))
+    rejected_count = int(status_counts.get("rejected", 0))
     
     # Compact statistics bar
     stat_cols = st.columns(4)
     with stat_cols[0]:
         st.metric("Total", len(all_items))
     with stat_cols[1]:
-        st.metric("Filtered", len(filtered_items))
+        st.metric("Filtered", filtered_count)
     with stat_cols[2]:
-        approved_count = sum(1 for i in filtered_items if load_review_status(i.folder_path)["status"] == "approved")
         st.metric("✅", approved_count)
     with stat_cols[3]:
-        rejected_count = sum(1 for i in filtered_items if load_review_status(i.folder_path)["status"] == "rejected")
         st.metric("❌", rejected_count)
     
     # Progress bar showing review completion
-    if len(filtered_items) > 0:
+    if filtered_count > 0:
         reviewed_count = approved_count + rejected_count
-        progress = reviewed_count / len(filtered_items)
-        st.progress(progress, text=f"Reviewed: {reviewed_count}/{len(filtered_items)} ({progress:.0%})")
+        progress = reviewed_count / filtered_count
+        st.progress(progress, text=f"Reviewed: {reviewed_count}/{filtered_count} ({progress:.0%})")
     
     # Export button (collapsed on mobile)
     with st.expander("📥 Export", expanded=False):
-        if len(filtered_items) > 0:
-            csv_df = export_reviews_to_csv(filtered_items)
-            csv_data = csv_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download CSV",
-                data=csv_data,
-                file_name=f"review_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
+        if filtered_count > 0:
+            # Build the CSV only on request; a prepared export is reused until
+            # the filtered items or their review statuses change
+            prepare = st.button("🧾 Prepare CSV", key="prepare_export", use_container_width=True)
+            export_blob = st.session_state.get("export_blob")
+            if prepare or export_blob:
+                filtered_items = [all_items[i] for i in filtered_rows]
+                if prepare:
+                    # Encoded once here rather than by the download button every rerun
+                    export_blob = st.session_state.export_blob = (
+                        export_signature(filtered_items),
+                        export_reviews_to_csv(filtered_items).encode('utf-8'),
+                    )
+                if export_blob[0] != export_signature(filtered_items):
+                    # Out of date - don't keep the old CSV around in the session
+                    del st.session_state.export_blob
+                else:
+                    st.download_button(
+                        label="📥 Download CSV",
+                        data=export_blob[1],
+                        file_name=f"review_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
     
     # MOBILE-FRIENDLY PAGINATION - Prominent at top
-    total_pages = max(1, (len(filtered_items) + st.session_state.items_per_page - 1) // st.session_state.items_per_page)
-    
-    # Ensure current page is valid
-    if st.session_state.current_page >= total_pages:
-        st.session_state.current_page = total_pages - 1
-    if st.session_state.current_page < 0:
-        st.session_state.current_page = 0
-    
-    # Top pagination bar - mobile optimized
-    st.markdown("---")
-    nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
-    
-    with nav_col1:
-        if st.button("⬅️ Prev", disabled=(st.session_state.current_page == 0), use_container_width=True):
-            st.session_state.current_page -= 1
-            st.rerun()
-    
-    with nav_col2:
-        st.markdown(f"""
-        <div style="text-align: center; padding: 8px; background: rgba(128,128,128,0.1); border-radius: 8px; border: 1px solid rgba(128,128,128,0.2);">
-            <strong>{st.session_state.current_page + 1}</strong> / {total_pages}
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with nav_col3:
-        if st.button("Next ➡️", disabled=(st.session_state.current_page >= total_pages - 1), use_container_width=True):
-            st.session_state.current_page += 1
-            st.rerun()
-    
-    # Page jump (collapsed on mobile)
-    with st.expander("Jump to page", expanded=False):
-        jump_page = st.number_input(
-            "Go to page",
-            min_value=1,
-            max_value=total_pages,
-            value=st.session_state.current_page + 1,
-            step=1,
-            label_visibility="collapsed"
-        )
-        if st.button("Go", use_container_width=True):
-            st.session_state.current_page = jump_page - 1
-            st.rerun()
+    # Only the current page is rendered; the clamp keeps the page valid when
+    # filters shrink the result set
+    page_rows, st.session_state.current_page, total_pages = paginate(
+        filtered_rows, st.session_state.current_page, st.session_state.items_per_page
+    )
+    page_items = [all_items[i] for i in page_rows]
+    start_idx = st.session_state.current_page * st.session_state.items_per_page
     
+    # Top pagination bar - mobile optimized; a single page needs no controls
     st.markdown("---")
+    if total_pages > 1:
+        nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+        
+        with nav_col1:
+            st.button("⬅️ Prev", disabled=(st.session_state.current_page == 0), use_container_width=True,
+                      on_click=step_page, args=(-1,))
+        
+        with nav_col2:
+            page_indicator = st.empty()
+        
+        with nav_col3:
+            st.button("Next ➡️", disabled=(st.session_state.current_page >= total_pages - 1), use_container_width=True,
+                      on_click=step_page, args=(1,))
+        
+        render_page_indicator(page_indicator, st.session_state.current_page, total_pages)
+        
+        # Page jump (collapsed on mobile)
+        with st.expander("Jump to page", expanded=False):
+            st.number_input(
+                "Go to page",
+                min_value=1,
+                max_value=total_pages,
+                value=st.session_state.current_page + 1,
+                step=1,
+                key="jump_page",
+                label_visibility="collapsed"
+            )
+            st.button("Go", use_container_width=True, on_click=jump_to_page)
+        
+        st.markdown("---")
     
     # Display items for current page
-    start_idx = st.session_state.current_page * st.session_state.items_per_page
-    end_idx = min(start_idx + st.session_state.items_per_page, len(filtered_items))
-    page_items = filtered_items[start_idx:end_idx]
-    
     if not page_items:
         st.info("📭 No items found. Try adjusting your filters.")
     else:
@@ -2249,31 +3040,39 @@ def render_review_tab():
             render_review_item(item, start_idx + idx)
     
     # BOTTOM PAGINATION (duplicate for mobile convenience)
-    if len(filtered_items) > 0:
-        st.markdown("---")
-        bottom_col1, bottom_col2, bottom_col3 = st.columns([1, 2, 1])
-        
-        with bottom_col1:
-            if st.button("⬅️ Prev", key="prev_bottom", disabled=(st.session_state.current_page == 0), use_container_width=True):
-                st.session_state.current_page -= 1
-                st.rerun()
-        
-        with bottom_col2:
-            st.markdown(f"""
-            <div style="text-align: center; padding: 8px; background: rgba(128,128,128,0.1); border-radius: 8px; border: 1px solid rgba(128,128,128,0.2);">
-                <strong>{st.session_state.current_page + 1}</strong> / {total_pages}
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with bottom_col3:
-            if st.button("Next ➡️", key="next_bottom", disabled=(st.session_state.current_page >= total_pages - 1), use_container_width=True):
-                st.session_state.current_page += 1
-                st.rerun()
+    if filtered_count > 0:
+        if total_pages > 1:
+            st.markdown("---")
+            bottom_col1, bottom_col2, bottom_col3 = st.columns([1, 2, 1])
+            
+            with bottom_col1:
+                st.button("⬅️ Prev", key="prev_bottom", disabled=(st.session_state.current_page == 0),
+                          use_container_width=True, on_click=step_page, args=(-1,))
+            
+            with bottom_col2:
+                bottom_page_indicator = st.empty()
+            
+            with bottom_col3:
+                st.button("Next ➡️", key="next_bottom", disabled=(st.session_state.current_page >= total_pages - 1),
+                          use_container_width=True, on_click=step_page, args=(1,))
+            
+            render_page_indicator(bottom_page_indicator, st.session_state.current_page, total_pages)
         
         # Add extra padding at bottom for mobile
         st.markdown("<div style='height: 80px;'></div>", unsafe_allow_html=True)
 
 
+def jump_to_review(search: str):
+    """Button callback: switch to the Review view filtered to a song.
+    
+    Runs as on_click so the view selector's session key can still be set
+    before the radio is instantiated on the next run.
+    """
+    st.session_state.search_query = search
+    st.session_state.filter_content_type = "All"
+    st.session_state.active_tab = "Review"
+
+
 def render_catalog_tab():
     """Render the catalog browser tab for generating new content."""
     st.markdown("### 🎵 Song Catalog")
@@ -2324,18 +3123,18 @@ def render_catalog_tab():
     if 'catalog_page' not in st.session_state:
         st.session_state.catalog_page = 0
     
-    # Pagination controls
-    nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
-    with nav_col1:
-        if st.button("⬅️", key="cat_prev", disabled=(st.session_state.catalog_page == 0)):
-            st.session_state.catalog_page -= 1
-            st.rerun()
-    with nav_col2:
-        st.markdown(f"<div style='text-align:center;'><strong>{st.session_state.catalog_page + 1}</strong> / {total_pages}</div>", unsafe_allow_html=True)
-    with nav_col3:
-        if st.button("➡️", key="cat_next", disabled=(st.session_state.catalog_page >= total_pages - 1)):
-            st.session_state.catalog_page += 1
-            st.rerun()
+    # Pagination controls (only when there is more than one page)
+    if total_pages > 1:
+        nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+        with nav_col1:
+            st.button("⬅️", key="cat_prev", disabled=(st.session_state.catalog_page == 0),
+                      on_click=step_catalog_page, args=(-1,))
+        with nav_col2:
+            page_indicator = st.empty()
+        with nav_col3:
+            st.button("➡️", key="cat_next", disabled=(st.session_state.catalog_page >= total_pages - 1),
+                      on_click=step_catalog_page, args=(1,))
+        render_page_indicator(page_indicator, st.session_state.catalog_page, total_pages)
     
     # Get current page of songs
     start_idx = st.session_state.catalog_page * songs_per_page
@@ -2371,105 +3170,109 @@ def render_catalog_tab():
         else:
             outro_status = "❌"
         
-        with st.expander(f"**{title}** — {artist}  [{intro_status} Intro | {outro_status} Outro]"):
-            # Two-column layout: lyrics on left, info/actions on right
-            col_lyrics, col_actions = st.columns([1, 1])
-            
-            with col_lyrics:
-                st.markdown("**📜 Lyrics:**")
-                # Find and display lyrics
-                lyrics_file = find_lyrics_file(f"{artist.replace(' ', '_')}-{title.replace(' ', '_')}")
-                if lyrics_file:
-                    lyrics = load_lyrics(lyrics_file)
-                    # Show preview (first 300 chars) with option to expand
-                    if len(lyrics) > 300:
-                        st.text_area(
-                            "Lyrics preview",
-                            value=lyrics[:300] + "...",
-                            height=120,
-                            disabled=True,
-                            key=f"lyrics_preview_{song['id']}",
-                            label_visibility="collapsed"
-                        )
-                        with st.expander("📖 Full Lyrics"):
-                            st.text_area(
-                                "Full lyrics",
-                                value=lyrics,
-                                height=200,
-                                disabled=True,
-                                key=f"lyrics_full_{song['id']}",
-                                label_visibility="collapsed"
-                            )
-                    else:
-                        st.text_area(
-                            "Lyrics",
-                            value=lyrics,
-                            height=120,
-                            disabled=True,
-                            key=f"lyrics_{song['id']}",
-                            label_visibility="collapsed"
-                        )
-                else:
-                    st.info("No lyrics file found")
-            
-            with col_actions:
-                st.caption(f"Intro: Script {'✅' if status['intro_script'] else '❌'} | Audio {'✅' if status['intro_audio'] else '❌'}")
-                st.caption(f"Outro: Script {'✅' if status['outro_script'] else '❌'} | Audio {'✅' if status['outro_audio'] else '❌'}")
-                
-                # Generation buttons
-                st.markdown("**Generate:**")
+        # Lyrics and per-song widgets only run while the row is open
+        song_expander = st.expander(f"**{title}** — {artist}  [{intro_status} Intro | {outro_status} Outro]",
+                                    key=f"cat_exp_{song['id']}", on_change="rerun")
+        if song_expander.open:
+            with song_expander:
+                # Two-column layout: lyrics on left, info/actions on right
+                col_lyrics, col_actions = st.columns([1, 1])
                 
-                content_type = st.selectbox(
-                    "Content",
-                    ["intros", "outros"],
-                    key=f"ct_{song['id']}",
-                    label_visibility="collapsed"
-                )
-                regen_type = st.selectbox(
-                    "Generate",
-                    ["both", "script", "audio"],
-                    key=f"rt_{song['id']}",
-                    label_visibility="collapsed"
-                )
-                
-                col_btn1, col_btn2 = st.columns(2)
-                with col_btn1:
-                    if st.button("➕ Queue", key=f"add_{song['id']}", use_container_width=True):
-                        if add_catalog_item_to_queue(artist, title, dj, content_type, regen_type):
-                            st.success(f"Added!")
-                            st.rerun()
+                with col_lyrics:
+                    st.markdown("**📜 Lyrics:**")
+                    # Find and display lyrics
+                    lyrics_file = find_lyrics_file(f"{artist.replace(' ', '_')}-{title.replace(' ', '_')}")
+                    if lyrics_file:
+                        lyrics = load_lyrics(lyrics_file)
+                        # Read-only previews use st.code (plain element, no widget state)
+                        # Show preview (first 300 chars) with option to expand
+                        if len(lyrics) > 300:
+                            st.code(lyrics[:300] + "...", language=None, height=120, wrap_lines=True)
+                            with st.expander("📖 Full Lyrics"):
+                                st.code(lyrics, language=None, height=200, wrap_lines=True)
                         else:
-                            st.warning("Already in queue")
-                
-                with col_btn2:
-                    if st.button("⚡ Now", key=f"gen_{song['id']}", type="primary", use_container_width=True):
-                        with st.spinner(f"Generating..."):
-                            try:
-                                item_id = f"{artist.replace(' ', '_')}-{title.replace(' ', '_')}"
-                                
-                                success, error = gui_backend.regenerate_content(
-                                    content_type_str=content_type,
-                                    dj_str=dj,
-                                    item_id=item_id,
-                                    regen_type=regen_type,
-                                    feedback="",
-                                )
-                                
-                                if success:
-                                    st.success(f"✅ Generated!")
-                                    st.rerun()
-                                else:
-                                    st.error(f"❌ {error}")
-                            except Exception as e:
-                                st.error(f"❌ {str(e)}")
+                            st.code(lyrics, language=None, height=120, wrap_lines=True)
+                    else:
+                        st.info("No lyrics file found")
                 
-                # Jump to Review button (if content exists)
-                if status["intro_script"] or status["outro_script"]:
-                    if st.button("📋 Go to Review", key=f"review_{song['id']}", use_container_width=True):
-                        # Set search filter to find this song
-                        st.session_state.search_query = title
-                        st.session_state.filter_content_type = "All"
-                        st.rerun()
+                with col_actions:
+                    # Single element for both status lines (one delta per song instead of two)
+                    st.markdown(
+                        f"<small>Intro: Script {'✅' if status['intro_script'] else '❌'} | "
+                        f"Audio {'✅' if status['intro_audio'] else '❌'}<br>"
+                        f"Outro: Script {'✅' if status['outro_script'] else '❌'} | "
+                        f"Audio {'✅' if status['outro_audio'] else '❌'}</small>",
+                        unsafe_allow_html=True
+                    )
+                    
+                    # Generation buttons
+                    st.markdown("**Generate:**")
+                    
+                    content_type = st.selectbox(
+                        "Content",
+                        ["intros", "outros"],
+                        key=f"ct_{song['id']}",
+                        label_visibility="collapsed"
+                    )
+                    regen_type = st.selectbox(
+                        "Generate",
+                        ["both", "script", "audio"],
+                        key=f"rt_{song['id']}",
+                        label_visibility="collapsed"
+                    )
+                    
+                    col_btn1, col_btn2 = st.columns(2)
+                    with col_btn1:
+                        if st.button("➕ Queue", key=f"add_{song['id']}", use_container_width=True):
+                            queued_keys = get_queued_keys()
+                            queue_key = (make_song_folder_name(artist, title), dj, content_type)
+                            if queue_key in queued_keys:
+                                # The set may predate a queue run outside this session
+                                sync_queue_count()
+                                queued_keys = get_queued_keys()
+                            if queue_key in queued_keys:
+                                st.warning("Already in queue")
+                            elif add_catalog_item_to_queue(artist, title, dj, content_type, regen_type):
+                                queued_keys.add(queue_key)
+                                st.success(f"Added!")
+                                st.rerun()
+                            else:
+                                queued_keys.add(queue_key)
+                                st.warning("Already in queue")
+                    
+                    with col_btn2:
+                        if st.button("⚡ Now", key=f"gen_{song['id']}", type="primary", use_container_width=True):
+                            with st.spinner(f"Generating..."):
+                                try:
+                                    item_id = f"{artist.replace(' ', '_')}-{title.replace(' ', '_')}"
+                                    
+                                    success, error = gui_backend.regenerate_content(
+                                        content_type_str=content_type,
+                                        dj_str=dj,
+                                        item_id=item_id,
+                                        regen_type=regen_type,
+                                        feedback="",
+                                    )
+                                    
+                                    if success:
+                                        st.success(f"✅ Generated!")
+                                        st.rerun()
+                                    else:
+                                        st.error(f"❌ {error}")
+                                except Exception as e:
+                                    st.error(f"❌ {str(e)}")
+                    
+                    # Jump to Review button (if content exists)
+                    if status["intro_script"] or status["outro_script"]:
+                        st.button(
+                            "📋 Go to Review",
+                            key=f"review_{song['id']}",
+                            use_container_width=True,
+                            on_click=jump_to_review,
+                            args=(title,)
+                        )
+        else:
+            keep_widget_state(f"ct_{song['id']}", f"rt_{song['id']}")
     
     # Legend
     st.markdown("---")
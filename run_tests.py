@@ -12,6 +12,21 @@ import subprocess
 from pathlib import Path
 
 
+def _check_tts(q):
+    """Preflight target: report whether the local TTS model loads.
+    
+    Runs in a child process so the model's GPU memory is released before
+    pytest starts, and a slow load can be cut off. Kept at module level
+    because the spawn start method (Windows, macOS) pickles the target.
+    """
+    from src.ai_radio.generation.tts_client import check_tts_available
+    try:
+        ok = check_tts_available()
+    except Exception:
+        ok = False
+    q.put(bool(ok))
+
+
 def main():
     args = sys.argv[1:]
     
@@ -49,37 +64,39 @@ def main():
     if mode == 'integration':
         # Lazy import of check functions to avoid importing heavy modules in mock mode
         from src.ai_radio.generation.llm_client import check_ollama_available
-        from src.ai_radio.generation.tts_client import check_tts_available
+        import importlib.util, multiprocessing, queue, time
         print("Performing preflight checks for required services...")
 
-        if not check_ollama_available():
-            print("ERROR: Ollama LLM service not available at http://localhost:11434")
-            print("Start Ollama (e.g., `ollama serve`) and try again.")
-            return 2
+        # Start the TTS model load first so it overlaps the Ollama check.
+        # Without the chatterbox package the model can't load; skip the interpreter spawn.
+        # A bare chatterbox/ directory on sys.path (like the empty one in the repo root)
+        # resolves as a namespace package with no origin, so it doesn't count. Probing
+        # chatterbox.tts_turbo instead would import the package, and torch with it.
+        tts_process = None
+        chatterbox_spec = importlib.util.find_spec("chatterbox")
+        if chatterbox_spec is not None and chatterbox_spec.origin is not None:
+            q = multiprocessing.Queue()
+            tts_process = multiprocessing.Process(target=_check_tts, args=(q,))
+            tts_process.start()
+        tts_deadline = time.monotonic() + 10  # 10 second timeout for TTS check
 
-        # Run TTS availability check with a short timeout to avoid long model loads
-        import multiprocessing, queue
-
-        def _check_tts(q):
-            try:
-                ok = check_tts_available()
-            except Exception:
-                ok = False
-            q.put(bool(ok))
-
-        q = multiprocessing.Queue()
-        p = multiprocessing.Process(target=_check_tts, args=(q,))
-        p.start()
-        p.join(10)  # 10 second timeout for TTS check
-        tts_ok = False
         try:
-            tts_ok = q.get_nowait()
-        except queue.Empty:
+            if not check_ollama_available():
+                print("ERROR: Ollama LLM service not available at http://localhost:11434")
+                print("Start Ollama (e.g., `ollama serve`) and try again.")
+                return 2
+
             tts_ok = False
+            if tts_process is not None:
+                tts_process.join(max(0.0, tts_deadline - time.monotonic()))
+                try:
+                    tts_ok = q.get_nowait()
+                except queue.Empty:
+                    tts_ok = False
         finally:
-            if p.is_alive():
-                p.terminate()
-                p.join()
+            if tts_process is not None and tts_process.is_alive():
+                tts_process.terminate()
+                tts_process.join()
 
         if not tts_ok:
             print("WARNING: TTS model not available (local Chatterbox model could not be loaded)")
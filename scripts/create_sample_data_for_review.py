@@ -193,8 +193,8 @@ def create_sample_audit_results():
 
 def create_empty_regen_queue():
     """Create an empty regeneration queue file."""
-    queue_file = DATA_DIR / "regeneration_queue.json"
-    queue_file.write_text("[]", encoding='utf-8')
+    queue_file = DATA_DIR / "regeneration_queue.jsonl"
+    queue_file.write_text("", encoding='utf-8')
     print("✓ Created empty regeneration queue")
 
 
@@ -1,10 +1,12 @@
 """
 Process items in the regeneration queue.
 
-Reads data/regeneration_queue.json and regenerates scripts/audio
+Reads data/regeneration_queue.jsonl and regenerates scripts/audio
 based on reviewer feedback, then clears the queue.
 """
 import json
+import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -18,9 +20,13 @@ from src.ai_radio.generation.pipeline import GenerationPipeline
 from src.ai_radio.generation.prompts import DJ
 
 
-REGEN_QUEUE_FILE = Path("data/regeneration_queue.json")
+REGEN_QUEUE_FILE = Path("data/regeneration_queue.jsonl")
+LEGACY_REGEN_QUEUE_FILE = Path("data/regeneration_queue.json")
 LOG_FILE = Path("logs/regeneration_log.txt")
 
+# Trailing version number of a script/audio stem (julie_1, julie_outro_2, julie_1_full)
+VERSION_SUFFIX_RE = re.compile(r'_(\d+)(?:_(?:30sec|full))?$')
+
 
 def log_message(message: str):
     """Log a message to both console and log file."""
@@ -51,20 +57,10 @@ def get_next_version_number(folder_path: Path, dj: str, content_type: str = None
     
     max_version = 0
     for file_path in existing_files:
-        try:
-            stem_parts = file_path.stem.split('_')
-            if content_type == "outros":
-                # julie_outro or julie_outro_1
-                if len(stem_parts) > 2:
-                    version = int(stem_parts[-1])
-                    max_version = max(max_version, version)
-                # else version 0 (julie_outro)
-            else:
-                # julie_0 or julie_1
-                version = int(stem_parts[-1])
-                max_version = max(max_version, version)
-        except (ValueError, IndexError):
-            pass
+        # Unnumbered outro files (julie_outro, julie_outro_full) are version 0
+        match = VERSION_SUFFIX_RE.search(file_path.stem)
+        if match:
+            max_version = max(max_version, int(match.group(1)))
     
     return max_version + 1
 
@@ -303,15 +299,65 @@ def regenerate_weather_announcement(pipeline: GenerationPipeline, item: Dict[str
         return False
 
 
+def load_queue(queue_file: Path = REGEN_QUEUE_FILE,
+               legacy_file: Path = LEGACY_REGEN_QUEUE_FILE) -> List[Dict[str, Any]]:
+    """Load queued items: any legacy JSON-array file, then one JSON object per line."""
+    return load_legacy_queue(legacy_file) + parse_queue_lines(read_queue_lines(queue_file))
+
+
+def load_legacy_queue(legacy_file: Path = LEGACY_REGEN_QUEUE_FILE) -> List[Dict[str, Any]]:
+    """Items left in the pre-JSONL regeneration_queue.json array (empty if none)."""
+    if not legacy_file.exists():
+        return []
+    return json.loads(legacy_file.read_text(encoding='utf-8'))
+
+
+def read_queue_lines(queue_file: Path = REGEN_QUEUE_FILE) -> List[str]:
+    """Non-blank lines of the JSONL queue file (empty if it doesn't exist)."""
+    if not queue_file.exists():
+        return []
+    return [line for line in queue_file.read_text(encoding='utf-8').splitlines() if line.strip()]
+
+
+def parse_queue_lines(lines: List[str]) -> List[Dict[str, Any]]:
+    """Parse JSONL queue lines, skipping (and logging) malformed ones like the GUI does."""
+    queue = []
+    for line in lines:
+        try:
+            queue.append(json.loads(line))
+        except json.JSONDecodeError:
+            log_message(f"Skipping malformed queue line: {line.strip()[:80]!r}")
+    return queue
+
+
+def drop_queue_lines(count: int, queue_file: Path = REGEN_QUEUE_FILE):
+    """Remove the first `count` lines of the JSONL queue, keeping later appends.
+    
+    The rest goes to a temp file that replaces the queue; the queue is
+    re-read just before the replace so a line the GUI appends meanwhile
+    isn't lost.
+    """
+    tmp_file = queue_file.with_name(queue_file.name + ".tmp")
+    while queue_file.exists():
+        snapshot = queue_file.read_bytes()
+        remaining = [line for line in snapshot.decode('utf-8').splitlines() if line.strip()][count:]
+        tmp_file.write_text("".join(line + "\n" for line in remaining), encoding='utf-8')
+        if queue_file.read_bytes() == snapshot:
+            os.replace(tmp_file, queue_file)
+            return
+
+
 def process_queue():
     """Process all items in the regeneration queue."""
-    if not REGEN_QUEUE_FILE.exists():
+    if not REGEN_QUEUE_FILE.exists() and not LEGACY_REGEN_QUEUE_FILE.exists():
         log_message("No regeneration queue found.")
         return
     
     # Load queue
     try:
-        queue = json.loads(REGEN_QUEUE_FILE.read_text(encoding='utf-8'))
+        # Remember how many lines were taken so later appends survive the cleanup
+        queue_lines = read_queue_lines()
+        queue = load_legacy_queue() + parse_queue_lines(queue_lines)
     except Exception as e:
         log_message(f"Error loading queue: {e}")
         return
@@ -357,8 +403,9 @@ def process_queue():
         else:
             fail_count += 1
     
-    # Clear queue after processing
-    REGEN_QUEUE_FILE.write_text("[]", encoding='utf-8')
+    # Drop the processed entries; lines the GUI appended while this ran stay queued
+    LEGACY_REGEN_QUEUE_FILE.unlink(missing_ok=True)
+    drop_queue_lines(len(queue_lines))
     
     log_message(f"\nRegeneration complete: {success_count} succeeded, {fail_count} failed")
     log_message("Queue cleared.")
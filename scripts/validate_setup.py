@@ -17,13 +17,13 @@ if str(ROOT / "src") not in sys.path:
 
 
 def check_python_version() -> bool:
-    """Check Python version is 3.8+."""
+    """Check Python version is 3.10+."""
     version = sys.version_info
-    if version.major >= 3 and version.minor >= 8:
+    if version >= (3, 10):
         print(f"✅ Python {version.major}.{version.minor}.{version.micro}")
         return True
     else:
-        print(f"❌ Python {version.major}.{version.minor} (need 3.8+)")
+        print(f"❌ Python {version.major}.{version.minor} (need 3.10+)")
         return False
 
 
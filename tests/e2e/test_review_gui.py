@@ -26,6 +26,16 @@ from pathlib import Path
 from playwright.sync_api import Page, expect
 
 
+# The sidebar's "Items per page" default
+DEFAULT_ITEMS_PER_PAGE = 10
+
+
+def _filtered_count(page: Page) -> int:
+    """Value of the "Filtered" metric on the review tab."""
+    metric = page.get_by_test_id("stMetric").filter(has_text="Filtered")
+    return int(metric.get_by_test_id("stMetricValue").inner_text().replace(",", ""))
+
+
 class TestReviewGUI:
     """Test suite for Review GUI end-to-end functionality."""
     
@@ -227,13 +237,19 @@ class TestReviewGUIFilters:
             assert any(char.isdigit() for char in value_text)
     
     def test_pagination_controls_work(self, page: Page):
-        """Pagination controls are present and functional."""
-        # Check for pagination buttons
-        expect(page.get_by_role("button", name="⬅️ Previous")).to_be_visible()
-        expect(page.get_by_role("button", name="Next ➡️")).to_be_visible()
-        
-        # Page indicator should show
-        expect(page.locator("text=Page")).to_be_visible()
+        """Pagination controls show only when the results span several pages."""
+        prev_buttons = page.get_by_role("button", name="⬅️ Prev")
+        next_buttons = page.get_by_role("button", name="Next ➡️")
+        
+        if _filtered_count(page) > DEFAULT_ITEMS_PER_PAGE:
+            # Top and bottom navigation rows, with a "page / total" indicator
+            expect(prev_buttons.first).to_be_visible()
+            expect(next_buttons.first).to_be_visible()
+            expect(page.locator("text=/^1 \\/ \\d+$/").first).to_be_visible()
+        else:
+            # Everything fits on one page - no pagination controls at all
+            expect(prev_buttons).to_have_count(0)
+            expect(next_buttons).to_have_count(0)
     
     def test_refresh_button_works(self, page: Page):
         """Refresh button reloads data without errors."""
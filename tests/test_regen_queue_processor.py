@@ -16,8 +16,11 @@ import sys
 scripts_dir = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(scripts_dir))
 
+import process_regen_queue
 from process_regen_queue import (
+    drop_queue_lines,
     get_next_version_number,
+    load_queue,
     parse_song_info_from_folder,
     parse_time_info_from_folder
 )
@@ -49,6 +52,11 @@ def test_get_next_version_number_intros(tmp_path):
     (folder / "julie_3.txt").write_text("v3")
     next_ver = get_next_version_number(folder, "julie", "intros")
     assert next_ver == 4
+    
+    # Dual reference audio counts toward the version too
+    (folder / "julie_4_full.wav").write_bytes(b"wav4")
+    next_ver = get_next_version_number(folder, "julie", "intros")
+    assert next_ver == 5
 
 
 @pytest.mark.mock
@@ -114,8 +122,8 @@ def test_parse_time_info_from_folder():
 
 @pytest.mark.mock
 def test_queue_file_structure(tmp_path):
-    """Test regeneration queue JSON structure."""
-    queue_file = tmp_path / "regeneration_queue.json"
+    """Test regeneration queue JSONL structure."""
+    queue_file = tmp_path / "regeneration_queue.jsonl"
     
     # Create a sample queue
     queue = [
@@ -130,10 +138,10 @@ def test_queue_file_structure(tmp_path):
         }
     ]
     
-    queue_file.write_text(json.dumps(queue, indent=2), encoding='utf-8')
+    queue_file.write_text("".join(json.dumps(q) + "\n" for q in queue), encoding='utf-8')
     
     # Verify it can be read
-    loaded = json.loads(queue_file.read_text())
+    loaded = load_queue(queue_file, tmp_path / "regeneration_queue.json")
     assert len(loaded) == 1
     assert loaded[0]["content_type"] == "intros"
     assert loaded[0]["regenerate_type"] == "both"
@@ -253,8 +261,8 @@ def test_parse_time_info_from_folder():
 
 @pytest.mark.mock
 def test_queue_file_structure(tmp_path):
-    """Test regeneration queue JSON structure."""
-    queue_file = tmp_path / "regeneration_queue.json"
+    """Test regeneration queue JSONL structure."""
+    queue_file = tmp_path / "regeneration_queue.jsonl"
     
     # Create a sample queue
     queue = [
@@ -269,10 +277,10 @@ def test_queue_file_structure(tmp_path):
         }
     ]
     
-    queue_file.write_text(json.dumps(queue, indent=2), encoding='utf-8')
+    queue_file.write_text("".join(json.dumps(q) + "\n" for q in queue), encoding='utf-8')
     
     # Verify it can be read
-    loaded = json.loads(queue_file.read_text())
+    loaded = load_queue(queue_file, tmp_path / "regeneration_queue.json")
     assert len(loaded) == 1
     assert loaded[0]["content_type"] == "intros"
     assert loaded[0]["regenerate_type"] == "both"
@@ -299,3 +307,36 @@ def test_version_increment_logic():
     assert outro_pattern_v0.format(dj="mr_new_vegas") == "mr_new_vegas_outro.txt"
     assert outro_pattern_v1.format(dj="mr_new_vegas") == "mr_new_vegas_outro_1.txt"
 
+
+
+@pytest.mark.mock
+def test_load_queue_skips_malformed_lines(tmp_path, monkeypatch):
+    """Test a malformed queue line is skipped instead of failing the whole load."""
+    monkeypatch.setattr(process_regen_queue, 'LOG_FILE', tmp_path / "regeneration_log.txt")
+    queue_file = tmp_path / "regeneration_queue.jsonl"
+    queue_file.write_text('{"item_id": "a"}\n{"item_id": \n{"item_id": "b"}\n', encoding='utf-8')
+    
+    loaded = load_queue(queue_file, tmp_path / "regeneration_queue.json")
+    
+    assert [q["item_id"] for q in loaded] == ["a", "b"]
+
+
+@pytest.mark.mock
+def test_drop_queue_lines_keeps_append_during_rewrite(tmp_path, monkeypatch):
+    """Test a line the GUI appends while the queue is rewritten survives the cleanup."""
+    queue_file = tmp_path / "regeneration_queue.jsonl"
+    queue_file.write_text('{"item_id": "a"}\n{"item_id": "b"}\n', encoding='utf-8')
+    write_text = Path.write_text
+    
+    def write_then_append(self, *args, **kwargs):
+        # The GUI queues "c" while the temp file is being written
+        monkeypatch.setattr(Path, 'write_text', write_text)
+        with open(queue_file, 'a', encoding='utf-8') as f:
+            f.write('{"item_id": "c"}\n')
+        return write_text(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Path, 'write_text', write_then_append)
+    drop_queue_lines(2, queue_file)
+    
+    assert queue_file.read_text(encoding='utf-8') == '{"item_id": "c"}\n'
+    assert not (tmp_path / "regeneration_queue.jsonl.tmp").exists()
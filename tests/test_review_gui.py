@@ -8,6 +8,7 @@ These tests verify the core functionality of the review interface including:
 - Regeneration queue management
 - CSV export
 """
+import os
 import pytest
 import json
 from pathlib import Path
@@ -22,6 +23,9 @@ from review_gui import (
     add_to_regen_queue,
     get_regen_queue_count,
     clear_regen_queue,
+    get_queued_keys,
+    reset_queued_keys,
+    add_catalog_item_to_queue,
     export_reviews_to_csv,
     SCRIPT_ISSUES,
     AUDIO_ISSUES
@@ -75,8 +79,8 @@ def sample_generated_content(tmp_path):
     )
     
     # Create regeneration queue
-    queue_file = data_dir / "regeneration_queue.json"
-    queue_file.write_text("[]", encoding='utf-8')
+    queue_file = data_dir / "regeneration_queue.jsonl"
+    queue_file.write_text("", encoding='utf-8')
     
     return {
         "data_dir": data_dir,
@@ -117,6 +121,108 @@ def test_scan_generated_content(sample_generated_content, monkeypatch):
     assert weather_item.latest_version == 1
     assert len(weather_item.script_versions) == 2
     assert len(weather_item.audio_versions) == 2
+    
+    # Repeated status strings are shared (interned), and items carry no __dict__
+    assert len({id(item.review_status) for item in items}) == 1
+    assert not hasattr(weather_item, '__dict__')
+    
+    # Items are frozen snapshots and hashable (e.g. for de-duplication)
+    assert len(set(items + scan_generated_content())) == 4
+    from dataclasses import FrozenInstanceError
+    with pytest.raises(FrozenInstanceError):
+        weather_item.review_status = "approved"
+
+
+@pytest.mark.mock
+def test_scan_generated_content_cache_invalidation(sample_generated_content, monkeypatch):
+    """Test the shared content scan picks up new versions and saved review status."""
+    import review_gui
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'AUDIT_DIR', sample_generated_content['audit_dir'])
+    
+    items = scan_generated_content()
+    time_item = next(item for item in items if item.content_type == "time")
+    assert time_item.latest_version == 0
+    assert time_item.review_status == "pending"
+    
+    # New version file changes the item folder mtime -> new fingerprint
+    (time_item.folder_path / "julie_1.txt").write_text("v1", encoding='utf-8')
+    time_item = next(item for item in scan_generated_content() if item.content_type == "time")
+    assert time_item.latest_version == 1
+    
+    # Saving review status patches the shared scan result
+    save_review_status(time_item.folder_path, {"status": "approved"})
+    time_item = next(item for item in scan_generated_content() if item.content_type == "time")
+    assert time_item.review_status == "approved"
+
+
+@pytest.mark.mock
+def test_background_scan(sample_generated_content, monkeypatch):
+    """Test the review list's scan serves the last result while rescanning."""
+    import review_gui
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'AUDIT_DIR', sample_generated_content['audit_dir'])
+    scan = review_gui.BackgroundScan()
+    
+    # Nothing to show yet - the first call waits for the worker
+    (items, frame), is_current = scan.get(review_gui._content_fingerprint())
+    assert is_current and len(items) == len(frame) == 4
+    
+    # New content: the previous result is served until the rescan finishes
+    new_folder = sample_generated_content['generated_dir'] / "time" / "julie" / "13-00"
+    new_folder.mkdir()
+    (new_folder / "julie_0.txt").write_text("Test time script", encoding='utf-8')
+    fingerprint = review_gui._content_fingerprint()
+    (items, _), is_current = scan.get(fingerprint)
+    if not is_current:
+        assert len(items) == 4
+    (items, _), is_current = scan.get(fingerprint, wait=True)
+    assert is_current and len(items) == 5
+    
+    # invalidate() drops the result so the next caller sees fresh data
+    status_file = new_folder / "review_status.json"
+    status_file.write_text('{"status": "pending"}', encoding='utf-8')
+    fingerprint = review_gui._content_fingerprint()
+    scan.invalidate()
+    (items, _), is_current = scan.get(fingerprint)
+    assert is_current and len(items) == 5
+    
+    # An in-place edit the fingerprint can't see is picked up once the TTL lapses
+    status_file.write_text('{"status": "approved"}', encoding='utf-8')
+    assert review_gui._content_fingerprint() == fingerprint
+    monkeypatch.setattr(review_gui, 'SCAN_TTL', 0)
+    assert scan.get(fingerprint)[1]  # expired: still current, refreshes in the background
+    (items, _), is_current = scan.get(fingerprint, wait=True)
+    assert next(i for i in items if i.item_id == "13-00").review_status == "approved"
+    
+    # Saving a review status patches the result in place of a rescan
+    monkeypatch.setattr(review_gui, 'SCAN_TTL', 60)
+    monkeypatch.setattr(review_gui, 'content_scan', lambda: scan)
+    rescans = []
+    monkeypatch.setattr(review_gui, '_scan_generated_content', lambda *caches: rescans.append(1) or [])
+    review_gui.save_review_status(new_folder, {"status": "rejected"})
+    (items, frame), is_current = scan.get(review_gui._content_fingerprint())
+    assert is_current and not rescans and len(items) == 5
+    assert next(i for i in items if i.item_id == "13-00").review_status_data == {"status": "rejected"}
+    assert frame['review_status'].tolist().count("rejected") == 1
+
+
+@pytest.mark.mock
+def test_scan_workers_do_not_touch_streamlit_caches(sample_generated_content, monkeypatch):
+    """Test the scan's cache lookups all happen on the calling thread."""
+    import threading
+    import review_gui
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'AUDIT_DIR', sample_generated_content['audit_dir'])
+    threads = set()
+    for name in ('current_audit_index', '_review_status_memo'):
+        cached = getattr(review_gui, name)
+        monkeypatch.setattr(review_gui, name,
+                            lambda cached=cached: threads.add(threading.current_thread().name) or cached())
+    
+    (items, _), is_current = review_gui.BackgroundScan().get(review_gui._content_fingerprint())
+    assert is_current and len(items) == 4
+    assert threads == {threading.current_thread().name}
 
 
 @pytest.mark.mock
@@ -170,6 +276,7 @@ def test_filter_items(sample_generated_content, monkeypatch):
     # Test no filtering
     filtered = filter_items(items)
     assert len(filtered) == 4
+    assert filtered == items and filtered is not items
     
     # Test content type filter
     st.session_state.filter_content_type = "intros"
@@ -195,6 +302,57 @@ def test_filter_items(sample_generated_content, monkeypatch):
     filtered = filter_items(items)
     assert len(filtered) == 1
     assert "Test_Artist" in filtered[0].item_id
+    assert filter_items([]) == []
+    
+    # A prebuilt item frame gives the same result as one built per call
+    from review_gui import build_item_frame
+    frame = build_item_frame(items)
+    assert filter_items(items, frame) == filtered
+    
+    # A status no item has yet is simply absent from the categorical column
+    st.session_state.search_query = ""
+    st.session_state.filter_review_status = "Rejected"
+    assert filter_items(items, frame) == []
+    
+    # filter_rows reuses its result until the frame or a filter changes
+    rows, counts = review_gui.filter_rows(frame)
+    assert len(rows) == 0
+    assert review_gui.filter_rows(frame)[0] is rows
+    st.session_state.filter_review_status = "Pending"
+    rows, counts = review_gui.filter_rows(frame)
+    assert len(rows) == len(items) and counts["pending"] == len(items)
+
+
+@pytest.mark.mock
+def test_search_hits_matches_substring_scan(monkeypatch):
+    """Test the joined-key search agrees with a per-key substring test."""
+    import types
+    import pandas as pd
+    import streamlit as st
+    from review_gui import search_hits
+    monkeypatch.setattr(st, 'session_state', types.SimpleNamespace())
+    
+    keys = ["test artist-blue skies", "skies", "other artist-song", "", "blue blue", "artist"]
+    frame = pd.DataFrame({'item_id_lower': pd.Series(keys, dtype=object)})
+    for query in ["blue", "skies", "artist", "t-b", "s\no", "missing", " "]:
+        expected = [query in key for key in keys]
+        assert search_hits(frame, query).tolist() == expected, query
+    assert search_hits(frame.iloc[:0], "blue").tolist() == []
+
+
+@pytest.mark.mock
+def test_paginate():
+    """Test that only one clamped page of items is returned."""
+    from review_gui import paginate
+
+    items = list(range(23))
+    assert paginate(items, 0, 10) == (list(range(10)), 0, 3)
+    assert paginate(items, 2, 10) == ([20, 21, 22], 2, 3)
+
+    # Out-of-range pages are clamped (e.g. after a filter shrinks the list)
+    assert paginate(items, 7, 10) == ([20, 21, 22], 2, 3)
+    assert paginate(items, -1, 10)[1] == 0
+    assert paginate([], 3, 10) == ([], 0, 1)
 
 
 @pytest.mark.mock
@@ -226,6 +384,17 @@ def test_load_save_review_status(tmp_path):
     assert loaded_status["reviewer_notes"] == "Test notes"
     assert "Character voice mismatch" in loaded_status["script_issues"]
     assert "Pacing issues" in loaded_status["audio_issues"]
+    
+    # Loads are memoized, but each caller gets its own copy to modify
+    loaded_status["status"] = "approved"
+    assert load_review_status(folder)["status"] == "rejected"
+    
+    # Re-saving an unchanged status leaves the file alone; no temp file remains
+    status_file = folder / "review_status.json"
+    os.utime(status_file, ns=(0, 0))
+    save_review_status(folder, new_status)
+    assert status_file.stat().st_mtime_ns == 0
+    assert [p.name for p in folder.iterdir()] == ["review_status.json"]
 
 
 @pytest.mark.mock
@@ -245,6 +414,28 @@ def test_get_audit_status(sample_generated_content, monkeypatch):
     # Test no audit (should return None)
     status = get_audit_status("outros", "mr_new_vegas", "Other_Artist-Other_Song")
     assert status is None
+    
+    # Prebuilt index gives the same answers without probing
+    from review_gui import build_audit_index
+    audit_index = build_audit_index()
+    assert get_audit_status("intros", "julie", "Test_Artist-Test_Song", audit_index) == "passed"
+    assert get_audit_status("time", "julie", "12-00", audit_index) == "failed"
+    assert get_audit_status("outros", "mr_new_vegas", "Other_Artist-Other_Song", audit_index) is None
+    
+    # The cached index follows files added to the audit directories
+    from review_gui import current_audit_index
+    assert current_audit_index() == audit_index
+    passed_dir = sample_generated_content['audit_dir'] / "mr_new_vegas" / "passed"
+    passed_dir.mkdir(parents=True, exist_ok=True)
+    (passed_dir / "Other_Artist-Other_Song_outro_audit.json").write_text("{}", encoding='utf-8')
+    assert get_audit_status("outros", "mr_new_vegas", "Other_Artist-Other_Song", current_audit_index()) == "passed"
+    
+    # Audit stage naming (core.paths): song_intro / time_announcement / weather_announcement
+    failed_dir = sample_generated_content['audit_dir'] / "mr_new_vegas" / "failed"
+    failed_dir.mkdir(parents=True, exist_ok=True)
+    (failed_dir / "06-00_weather_announcement_audit.json").write_text("{}", encoding='utf-8')
+    assert get_audit_status("weather", "mr_new_vegas", "06-00") == "failed"
+    assert get_audit_status("weather", "mr_new_vegas", "06-00", current_audit_index()) == "failed"
 
 
 @pytest.mark.mock
@@ -274,7 +465,8 @@ def test_regeneration_queue(sample_generated_content, monkeypatch):
     assert count == 1
     
     # Verify queue contents
-    queue_data = json.loads(sample_generated_content['queue_file'].read_text())
+    lines = sample_generated_content['queue_file'].read_text().splitlines()
+    queue_data = [json.loads(line) for line in lines]
     assert len(queue_data) == 1
     assert queue_data[0]["content_type"] == "intros"
     assert queue_data[0]["dj"] == "julie"
@@ -290,6 +482,210 @@ def test_regeneration_queue(sample_generated_content, monkeypatch):
     clear_regen_queue()
     count = get_regen_queue_count()
     assert count == 0
+    
+    # A missing queue file reads as empty and clearing doesn't create it
+    sample_generated_content['queue_file'].unlink()
+    assert get_regen_queue_count() == 0
+    assert review_gui._read_regen_queue() == []
+    clear_regen_queue()
+    assert not sample_generated_content['queue_file'].exists()
+
+
+@pytest.mark.mock
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_queue_json_roundtrip(sample_generated_content, monkeypatch, use_orjson):
+    """Test queue entries round-trip with and without orjson installed."""
+    import review_gui
+    if not use_orjson:
+        monkeypatch.setattr(review_gui, 'orjson', None)
+    monkeypatch.setattr(review_gui, 'REGEN_QUEUE_FILE', sample_generated_content['queue_file'])
+    
+    review_gui._append_regen_queue({"item_id": "Joséphine", "added_at": datetime(2026, 1, 25, 10, 35)})
+    
+    assert review_gui._read_regen_queue() == [{"item_id": "Joséphine", "added_at": "2026-01-25T10:35:00"}]
+
+
+@pytest.mark.mock
+def test_consume_regen_queue_keeps_later_appends(sample_generated_content, monkeypatch):
+    """Test processing removes only the entries it read."""
+    import review_gui
+    monkeypatch.setattr(review_gui, 'REGEN_QUEUE_FILE', sample_generated_content['queue_file'])
+    review_gui._append_regen_queue({"item_id": "a"}, {"item_id": "b"})
+    # Queued while "a" and "b" were being processed
+    review_gui._append_regen_queue({"item_id": "c"})
+    
+    review_gui.consume_regen_queue(2)
+    
+    assert [q["item_id"] for q in review_gui._read_regen_queue()] == ["c"]
+
+
+@pytest.mark.mock
+def test_consume_regen_queue_keeps_append_during_rewrite(sample_generated_content, monkeypatch):
+    """Test an entry appended while the remaining queue is rewritten survives."""
+    import review_gui
+    monkeypatch.setattr(review_gui, 'REGEN_QUEUE_FILE', sample_generated_content['queue_file'])
+    review_gui._append_regen_queue({"item_id": "a"}, {"item_id": "b"})
+    parse = review_gui._parse_regen_queue
+    
+    def parse_then_append(data):
+        # Another session queues "c" after the snapshot was taken
+        monkeypatch.setattr(review_gui, '_parse_regen_queue', parse)
+        review_gui._append_regen_queue({"item_id": "c"})
+        return parse(data)
+    
+    monkeypatch.setattr(review_gui, '_parse_regen_queue', parse_then_append)
+    review_gui.consume_regen_queue(2)
+    
+    assert [q["item_id"] for q in review_gui._read_regen_queue()] == ["c"]
+    assert not sample_generated_content['queue_file'].with_name("regeneration_queue.jsonl.tmp").exists()
+
+
+@pytest.mark.mock
+def test_migrate_legacy_regen_queue(sample_generated_content, monkeypatch):
+    """Test entries in the old JSON-array queue file move to the JSONL queue."""
+    import review_gui
+    legacy_file = sample_generated_content['data_dir'] / "regeneration_queue.json"
+    legacy_file.write_text(json.dumps([{"item_id": "a"}, {"item_id": "b"}]), encoding='utf-8')
+    monkeypatch.setattr(review_gui, 'REGEN_QUEUE_FILE', sample_generated_content['queue_file'])
+    monkeypatch.setattr(review_gui, 'LEGACY_REGEN_QUEUE_FILE', legacy_file)
+    
+    review_gui.migrate_legacy_regen_queue()
+    
+    assert not legacy_file.exists()
+    assert get_regen_queue_count() == 2
+    assert [q["item_id"] for q in review_gui._read_regen_queue()] == ["a", "b"]
+
+
+@pytest.mark.mock
+def test_audio_player_warns_when_scanned_file_is_deleted(sample_generated_content, monkeypatch):
+    """Test a WAV deleted after the scan shows the not-found warning instead of crashing."""
+    import review_gui
+    from streamlit.testing.v1 import AppTest
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'AUDIT_DIR', sample_generated_content['audit_dir'])
+    
+    items = scan_generated_content()
+    time_item = next(item for item in items if item.content_type == "time")
+    audio_path = time_item.get_audio_path(0)
+    audio_path.unlink()
+    
+    def app(audio_path):
+        from review_gui import render_audio_player
+        
+        render_audio_player(audio_path)
+    
+    at = AppTest.from_function(app, args=(audio_path,))
+    at.run()
+    
+    assert not at.exception
+    assert [w.value for w in at.warning] == ["Audio file not found"]  # 🔇 is shown as the icon
+
+
+@pytest.mark.mock
+def test_keep_widget_state_across_collapsed_expander():
+    """Test a choice inside a lazy expander survives it being collapsed and reopened."""
+    from streamlit.testing.v1 import AppTest
+    
+    def app():
+        import streamlit as st
+        from review_gui import keep_widget_state
+        
+        expander = st.expander("Song", key="row_exp", on_change="rerun")
+        if expander.open:
+            with expander:
+                st.selectbox("Content", ["intros", "outros"], key="ct_row")
+        else:
+            keep_widget_state("ct_row", "never_rendered")
+    
+    at = AppTest.from_function(app)
+    at.session_state["row_exp"] = True
+    at.run()
+    at.selectbox(key="ct_row").select("outros")
+    at.session_state["row_exp"] = True
+    at.run()
+    
+    # Two runs with the row collapsed, then reopen it
+    at.session_state["row_exp"] = False
+    at.run()
+    at.run()
+    at.session_state["row_exp"] = True
+    at.run()
+    
+    assert not at.exception
+    assert at.selectbox(key="ct_row").value == "outros"
+    assert "never_rendered" not in at.session_state
+
+
+class AttrDict(dict):
+    """Minimal stand-in for st.session_state (dict + attribute access)."""
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+@pytest.mark.mock
+def test_queued_keys_loaded_once_per_session(sample_generated_content, monkeypatch):
+    """Test the session set of queued catalog keys mirrors the queue file."""
+    import review_gui
+    import streamlit as st
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'REGEN_QUEUE_FILE', sample_generated_content['queue_file'])
+    monkeypatch.setattr(st, 'session_state', AttrDict())
+    
+    assert add_catalog_item_to_queue("Test Artist", "Test Song", "julie", "intros", "both")
+    
+    keys = get_queued_keys()
+    assert ("Test_Artist-Test_Song", "julie", "intros") in keys
+    
+    # Later queue writes are not re-read until the set is reset
+    add_catalog_item_to_queue("Other Artist", "Other Song", "julie", "outros", "both")
+    assert get_queued_keys() is keys
+    assert len(keys) == 1
+    
+    reset_queued_keys()
+    assert len(get_queued_keys()) == 2
+
+
+@pytest.mark.mock
+def test_sync_queue_count_drops_keys_consumed_elsewhere(sample_generated_content, monkeypatch):
+    """Test songs queued and then processed outside the session can be queued again."""
+    import review_gui
+    import streamlit as st
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'REGEN_QUEUE_FILE', sample_generated_content['queue_file'])
+    monkeypatch.setattr(st, 'session_state', AttrDict(queue_count=get_regen_queue_count()))
+    key = ("Test_Artist-Test_Song", "julie", "intros")
+    
+    add_catalog_item_to_queue("Test Artist", "Test Song", "julie", "intros", "both")
+    assert key in get_queued_keys()
+    
+    # Unchanged queue: the set is kept
+    keys = get_queued_keys()
+    review_gui.sync_queue_count()
+    assert get_queued_keys() is keys
+    
+    # The CLI processor consumes the queue
+    sample_generated_content['queue_file'].write_text("", encoding='utf-8')
+    review_gui.sync_queue_count()
+    
+    assert st.session_state.queue_count == 0
+    assert key not in get_queued_keys()
+
+
+@pytest.mark.mock
+def test_session_queue_count_tracks_adds_and_clear(sample_generated_content, monkeypatch):
+    """Test the session queue count follows appends and clears without re-reading."""
+    import review_gui
+    import streamlit as st
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'REGEN_QUEUE_FILE', sample_generated_content['queue_file'])
+    monkeypatch.setattr(st, 'session_state', AttrDict(queue_count=get_regen_queue_count()))
+    
+    add_catalog_item_to_queue("Test Artist", "Test Song", "julie", "intros", "both")
+    add_catalog_item_to_queue("Test Artist", "Test Song", "julie", "intros", "both")  # duplicate, not added
+    assert st.session_state.queue_count == get_regen_queue_count() == 1
+    
+    clear_regen_queue()
+    assert st.session_state.queue_count == 0
 
 
 @pytest.mark.mock
@@ -313,10 +709,15 @@ def test_export_reviews_to_csv(sample_generated_content, monkeypatch):
         }
         save_review_status(item.folder_path, status)
     
+    # Export reads the status captured by the scan, so rescan after saving
+    items = scan_generated_content()
+    
     # Export to CSV
-    df = export_reviews_to_csv(items)
+    import io
+    import pandas as pd
+    df = pd.read_csv(io.StringIO(export_reviews_to_csv(items)))
     
-    # Verify DataFrame structure
+    # Verify CSV structure
     assert len(df) == 4
     assert "content_type" in df.columns
     assert "dj" in df.columns
@@ -375,6 +776,183 @@ def test_outro_naming_convention(sample_generated_content, monkeypatch):
     assert "mr_new_vegas_outro.txt" in str(script_path)
 
 
+@pytest.mark.mock
+def test_get_song_generation_status(sample_generated_content, monkeypatch):
+    """Test catalog status checks both path structures from one listing each."""
+    import review_gui
+    generated_dir = sample_generated_content['generated_dir']
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', generated_dir)
+    
+    status = review_gui.get_song_generation_status("Test Artist", "Test Song", "julie")
+    assert status == {"intro_script": True, "intro_audio": True,
+                      "outro_script": False, "outro_audio": False}
+    
+    # Legacy doubled outro folder with only reference audio
+    legacy = generated_dir / "outros" / "outros" / "julie" / "Test_Artist-Test_Song"
+    legacy.mkdir(parents=True)
+    (legacy / "julie_outro_30sec.wav").write_bytes(b"RIFF")
+    status = review_gui.get_song_generation_status("Test Artist", "Test Song", "julie")
+    assert status["outro_audio"] and not status["outro_script"]
+
+
+@pytest.mark.mock
+def test_get_song_content(sample_generated_content, monkeypatch):
+    """Test per-song lookup finds intros/outros and their audit status."""
+    import review_gui
+    monkeypatch.setattr(review_gui, 'GENERATED_DIR', sample_generated_content['generated_dir'])
+    monkeypatch.setattr(review_gui, 'AUDIT_DIR', sample_generated_content['audit_dir'])
+    
+    content = review_gui.get_song_content("Test_Artist-Test_Song")
+    assert [item.dj for item in content["intros"]] == ["julie"]
+    assert content["intros"][0].audit_status == "passed"
+    assert content["outros"] == []
+    
+    outro = review_gui.get_song_content("Other_Artist-Other_Song")["outros"][0]
+    assert outro.get_script_path(0).name == "mr_new_vegas_outro.txt"
+    
+    # A new version bumps the folder mtime, so the cached lookup is refreshed
+    folder = content["intros"][0].folder_path
+    (folder / "julie_1.txt").write_text("v1", encoding='utf-8')
+    stat = folder.stat()
+    os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert review_gui.get_song_content("Test_Artist-Test_Song")["intros"][0].latest_version == 1
+
+
+@pytest.mark.mock
+def test_read_script_text_tracks_mtime(tmp_path):
+    """Test that cached script reads pick up edits to the file."""
+    from review_gui import read_script_text
+    script = tmp_path / "julie_0.txt"
+    script.write_text("first", encoding='utf-8')
+    assert read_script_text(script) == "first"
+    
+    script.write_text("second", encoding='utf-8')
+    stat = script.stat()
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_script_text(script) == "second"
+    
+    # An edit within the same mtime tick is still seen when the size changes
+    mtime_ns = script.stat().st_mtime_ns
+    script.write_text("second, edited", encoding='utf-8')
+    os.utime(script, ns=(stat.st_atime_ns, mtime_ns))
+    assert read_script_text(script) == "second, edited"
+    assert read_script_text(tmp_path / "missing.txt") is None
+    
+    # Windows line endings read back as \n, as with Path.read_text
+    crlf = tmp_path / "julie_1.txt"
+    crlf.write_bytes("caf\u00e9\r\nline two\r".encode('utf-8'))
+    assert read_script_text(crlf) == "caf\u00e9\nline two\n"
+
+
+@pytest.mark.mock
+def test_get_available_songs_follows_lyrics_dir(tmp_path, monkeypatch):
+    """Test the cached song list picks up lyrics files added later."""
+    import review_gui
+    monkeypatch.setattr(review_gui, 'LYRICS_DIR', tmp_path)
+    (tmp_path / "Blue Skies by Test Artist.txt").write_text("la la", encoding='utf-8')
+    (tmp_path / "notes.txt").write_text("not a song", encoding='utf-8')
+    (tmp_path / "Blue Skies by Test Artist.lrc").write_text("", encoding='utf-8')
+    
+    songs = review_gui.get_available_songs()
+    assert [s["id"] for s in songs] == ["Test_Artist-Blue_Skies"]
+    assert review_gui.load_lyrics(songs[0]["lyrics_file"]) == "la la"
+    
+    (tmp_path / "Other Song by Other Artist.txt").write_text("", encoding='utf-8')
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert len(review_gui.get_available_songs()) == 2
+
+
+@pytest.mark.mock
+def test_format_song_title():
+    """Test folder names are turned back into display titles and artists."""
+    from review_gui import format_song_title
+    assert format_song_title("Arthur__Big_Boy__Crudup-That_s_All_Right") == (
+        "That's All Right", 'Arthur "Big Boy" Crudup')
+    assert format_song_title("Bing_Crosby___The_Andrews_Sisters-Don_t_Fence_Me_In") == (
+        "Don't Fence Me In", "Bing Crosby & The Andrews Sisters")
+    assert format_song_title("Test_Artist-We_ll_Meet_Again") == ("We'll Meet Again", "Test Artist")
+
+
+@pytest.mark.mock
+def test_find_lyrics_file_fuzzy_match(tmp_path, monkeypatch):
+    """Test apostrophe folder names resolve through the normalized-name index."""
+    import review_gui
+    monkeypatch.setattr(review_gui, 'LYRICS_DIR', tmp_path)
+    (tmp_path / "I'm Moving Out by Test Artist.txt").write_text("", encoding='utf-8')
+    
+    assert review_gui.find_lyrics_file("Test_Artist-I_m_Moving_Out").name == "I'm Moving Out by Test Artist.txt"
+    assert review_gui.find_lyrics_file("Test_Artist-Missing_Song") is None
+    
+    (tmp_path / "Blue Skies by Other Artist.txt").write_text("", encoding='utf-8')
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert review_gui.find_lyrics_file("Other__Artist-Blue_Skies").name == "Blue Skies by Other Artist.txt"
+
+
+@pytest.mark.mock
+def test_scan_item_folder_dual_audio(tmp_path):
+    """Test version parsing for dual reference audio, including outro version 0."""
+    from review_gui import _scan_item_folder
+    for name in ["julie_outro.txt", "julie_outro_1.txt", "julie_outro_30sec.wav",
+                 "julie_outro_full.wav", "julie_outro_1_full.wav", "julie_outro.txt.original"]:
+        (tmp_path / name).write_text("x")
+    
+    info = _scan_item_folder(tmp_path, "julie", "outros")
+    
+    assert len(info['script_versions']) == 2
+    assert len(info['audio_versions']) == 3
+    assert info['latest_version'] == 1
+    assert info['audio_30sec'][0].name == "julie_outro_30sec.wav"
+    assert info['audio_full'][0].name == "julie_outro_full.wav"
+    assert info['audio_full'][1].name == "julie_outro_1_full.wav"
+    assert info['script_backups'] == {"julie_outro.txt": tmp_path / "julie_outro.txt.original"}
+    assert info['has_review_status'] is False
+    
+    (tmp_path / "review_status.json").write_text("{}")
+    assert _scan_item_folder(tmp_path, "julie", "outros")['has_review_status'] is True
+    
+    # Audio for a version whose script hasn't been written yet still counts
+    (tmp_path / "julie_outro_2_full.wav").write_text("x")
+    assert _scan_item_folder(tmp_path, "julie", "outros")['latest_version'] == 2
+
+
+@pytest.mark.mock
+def test_scan_item_folder_orders_versions_numerically(tmp_path):
+    """Test that version 10+ files sort after version 2 so index == version."""
+    from review_gui import ReviewItem, _scan_item_folder
+    for version in range(12):
+        (tmp_path / f"julie_{version}.txt").write_text(str(version))
+        (tmp_path / f"julie_{version}.wav").write_bytes(b"RIFF")
+    
+    info = _scan_item_folder(tmp_path, "julie", "intros")
+    
+    assert [p.name for p in info['script_versions'][:3]] == ["julie_0.txt", "julie_1.txt", "julie_2.txt"]
+    assert info['latest_version'] == 11
+    item = ReviewItem("intros", "julie", tmp_path.name, tmp_path,
+                      info['script_versions'], info['audio_versions'])
+    assert item.get_script_path(2).name == "julie_2.txt"
+    assert item.get_script_path(11).name == "julie_11.txt"
+    assert info['audio_versions'][10].name == "julie_10.wav"
+
+
+@pytest.mark.mock
+def test_get_next_version_for_regen(tmp_path):
+    """Test the next regen version counts .txt and .wav files in one listing."""
+    from review_gui import _get_next_version_for_regen
+    assert _get_next_version_for_regen(tmp_path / "missing", "julie", "intros") == 0
+    assert _get_next_version_for_regen(tmp_path, "julie", "intros") == 0
+    
+    (tmp_path / "julie_0.txt").write_text("script")
+    (tmp_path / "julie_3_full.wav").write_bytes(b"RIFF")
+    (tmp_path / "mr_new_vegas_7.txt").write_text("other DJ")
+    (tmp_path / "review_status.json").write_text("{}")
+    assert _get_next_version_for_regen(tmp_path, "julie", "intros") == 4
+    
+    (tmp_path / "julie_outro.wav").write_bytes(b"RIFF")
+    assert _get_next_version_for_regen(tmp_path, "julie", "outros") == 1
+
+
 @pytest.mark.mock
 def test_review_status_persistence(tmp_path):
     """Test that review status persists across multiple loads."""